@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Sales Database Initialization Script
+
+Runs the same steps as init_database.py on asyncpg instead of psycopg:
+1. Creating the database if it doesn't exist
+2. Running the schema creation script
+3. Optionally populating with initial reference data (one transaction)
+4. Verifying the connection and collecting database info concurrently
+
+Requires the optional asyncpg dependency (pip install asyncpg).
+
+Usage:
+    python async_init.py [options]
+
+Options:
+    --drop-existing    Drop existing database before creating
+    --populate-ref     Populate with basic reference data
+    --schema-file      Path to schema SQL file (default: schema.sql)
+    --verbose          Enable verbose logging
+    --help            Show this help message
+"""
+
+import sys
+import asyncio
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+try:
+    import asyncpg
+except ImportError:
+    print("Error: asyncpg not installed. Install with: pip install asyncpg")
+    sys.exit(1)
+
+from config import get_config
+from queries import CONNECTION_TEST_QUERY, DATABASE_INFO_QUERY, REFERENCE_TABLES
+
+
+def quote_identifier(name: str) -> str:
+    """Quote an SQL identifier (asyncpg has no equivalent of psycopg.sql.Identifier)."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+class AsyncDatabaseInitializer:
+    """Handles database initialization for the sales system using asyncpg."""
+    
+    def __init__(self, config: Dict[str, Any], verbose: bool = False):
+        self.config = config
+        self.verbose = verbose
+        self.logger = self._setup_logging()
+        self.pool: Optional[asyncpg.Pool] = None
+    
+    def _setup_logging(self) -> logging.Logger:
+        """Set up logging configuration."""
+        level = logging.DEBUG if self.verbose else logging.INFO
+        logging.basicConfig(
+            level=level,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        return logging.getLogger(__name__)
+    
+    def _conn_params(self, database: Optional[str] = None) -> Dict[str, Any]:
+        """Connection parameters for asyncpg; no database means the server's default."""
+        conn_params = {
+            'host': self.config['host'],
+            'port': self.config['port'],
+            'user': self.config['user'],
+            'password': self.config['password']
+        }
+        
+        if database:
+            conn_params['database'] = database
+        
+        return conn_params
+    
+    async def open_pool(self) -> None:
+        """Create the connection pool for the target database."""
+        self.pool = await asyncpg.create_pool(min_size=1, max_size=8, **self._conn_params(self.config['database']))
+        self.logger.debug(f"Connected to database: {self.config['database']}")
+    
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+    
+    async def create_database(self, drop_existing: bool = False) -> bool:
+        """Create the target database."""
+        try:
+            conn = await asyncpg.connect(**self._conn_params())
+            try:
+                db_name = self.config['database']
+                exists = await conn.fetchval("SELECT EXISTS (SELECT 1 FROM pg_database WHERE datname = $1);", db_name)
+                
+                if drop_existing and exists:
+                    self.logger.warning(f"Dropping existing database: {db_name}")
+                    
+                    # Terminate active connections
+                    await conn.execute("""
+                        SELECT pg_terminate_backend(pg_stat_activity.pid)
+                        FROM pg_stat_activity
+                        WHERE pg_stat_activity.datname = $1
+                        AND pid <> pg_backend_pid();
+                    """, db_name)
+                    
+                    await conn.execute(f"DROP DATABASE IF EXISTS {quote_identifier(db_name)}")
+                    self.logger.info(f"Database {db_name} dropped successfully")
+                    exists = False
+                
+                if not exists:
+                    self.logger.info(f"Creating database: {db_name}")
+                    await conn.execute(f"CREATE DATABASE {quote_identifier(db_name)}")
+                    self.logger.info(f"Database {db_name} created successfully")
+                else:
+                    self.logger.info(f"Database {db_name} already exists")
+            finally:
+                await conn.close()
+            
+            return True
+        
+        except (asyncpg.PostgresError, OSError) as e:
+            self.logger.error(f"Error creating database: {e}")
+            return False
+    
+    async def run_schema_script(self, schema_file: str = "schema.sql") -> bool:
+        """Execute the schema creation script."""
+        try:
+            schema_path = Path(schema_file)
+            if not schema_path.exists():
+                self.logger.error(f"Schema file not found: {schema_path}")
+                return False
+            
+            self.logger.info(f"Reading schema from: {schema_path}")
+            schema_sql = schema_path.read_text(encoding='utf-8')
+            
+            self.logger.info("Executing schema creation script...")
+            
+            async with self.pool.acquire() as conn:
+                # Without arguments asyncpg uses the simple query protocol, which runs the
+                # whole multi-statement script in one round trip
+                async with conn.transaction():
+                    await conn.execute(schema_sql)
+                
+                tables = await conn.fetch("""
+                    SELECT table_name
+                    FROM information_schema.tables
+                    WHERE table_schema = 'public'
+                    ORDER BY table_name;
+                """)
+            
+            self.logger.info(f"Created {len(tables)} tables:")
+            for table in tables:
+                self.logger.info(f"  - {table['table_name']}")
+            
+            self.logger.info("Schema creation completed successfully!")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"Error running schema script: {e}")
+            return False
+    
+    async def populate_reference_data(self) -> bool:
+        """Populate database with basic reference data in a single transaction."""
+        try:
+            self.logger.info("Populating reference data...")
+            
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    for table, columns, conflict_column, rows in REFERENCE_TABLES:
+                        # Rows are COPYed into a temporary table and merged, so existing
+                        # reference rows are still skipped like with ON CONFLICT DO NOTHING.
+                        # The staging table only has the inserted columns and no defaults, so
+                        # the COPY doesn't draw values from the real table's id sequence.
+                        staging = f"tmp_{table}"
+                        column_list = ', '.join(columns)
+                        await conn.execute(
+                            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                            f"SELECT {column_list} FROM {table} WITH NO DATA;"
+                        )
+                        await conn.copy_records_to_table(staging, records=rows, columns=columns)
+                        await conn.execute(
+                            f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging} "
+                            f"ON CONFLICT ({conflict_column}) DO NOTHING;"
+                        )
+                
+                counts = await conn.fetchrow(
+                    "SELECT " + ", ".join(
+                        f"(SELECT COUNT(*) FROM {table}) AS {table}" for table, _, _, _ in REFERENCE_TABLES
+                    )
+                )
+            
+            self.logger.info(f"Reference data populated:")
+            self.logger.info(f"  - {counts['currencies']} currencies")
+            self.logger.info(f"  - {counts['countries']} countries")
+            self.logger.info(f"  - {counts['tax_types']} tax types")
+            self.logger.info(f"  - {counts['cost_types']} cost types")
+            self.logger.info(f"  - {counts['roles']} roles")
+            
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"Error populating reference data: {e}")
+            return False
+    
+    async def test_connection(self) -> bool:
+        """Test database connection."""
+        try:
+            self.logger.info("Testing database connection...")
+            
+            async with self.pool.acquire() as conn:
+                version, current_db, table_count = await conn.fetchrow(CONNECTION_TEST_QUERY)
+            
+            self.logger.info(f"PostgreSQL version: {version}")
+            self.logger.info(f"Connected to database: {current_db}")
+            
+            if table_count > 0:
+                self.logger.info(f"Found {table_count} main tables in database")
+            else:
+                self.logger.info("No main tables found - database may need initialization")
+            
+            self.logger.info("Connection test successful!")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"Connection test failed: {e}")
+            return False
+    
+    async def get_database_info(self) -> Dict[str, Any]:
+        """Get database information and statistics."""
+        try:
+            async with self.pool.acquire() as conn:
+                db_size, table_count = await conn.fetchrow(DATABASE_INFO_QUERY)
+            
+            return {
+                'database_name': self.config['database'],
+                'database_size': db_size,
+                'table_count': table_count
+            }
+        
+        except Exception as e:
+            self.logger.error(f"Error getting database info: {e}")
+            return {}
+
+
+async def run(args: argparse.Namespace, config: Dict[str, Any]) -> bool:
+    """Run the full initialization; returns False on the first failed step."""
+    db_init = AsyncDatabaseInitializer(config, verbose=args.verbose)
+    
+    # Step 1: Create database
+    if not await db_init.create_database(drop_existing=args.drop_existing):
+        print("Failed to create database")
+        return False
+    
+    try:
+        await db_init.open_pool()
+        
+        # Step 2: Run schema script
+        if not await db_init.run_schema_script(args.schema_file):
+            print("Failed to create schema")
+            return False
+        
+        # Step 3: Populate reference data (if requested)
+        if args.populate_ref:
+            if not await db_init.populate_reference_data():
+                print("Failed to populate reference data")
+                return False
+        
+        # Step 4: Final verification, overlapped with collecting the database info
+        success, info = await asyncio.gather(db_init.test_connection(), db_init.get_database_info())
+        if not success:
+            print("Final connection test failed")
+            return False
+        
+        print("=" * 50)
+        print("Database initialization completed successfully!")
+        
+        if info:
+            print(f"\nDatabase Summary:")
+            print(f"  Name: {info['database_name']}")
+            print(f"  Size: {info['database_size']}")
+            print(f"  Tables: {info['table_count']}")
+        
+        return True
+    finally:
+        await db_init.close()
+
+
+def main():
+    """Main function to handle command line arguments and run initialization."""
+    parser = argparse.ArgumentParser(
+        description='Initialize the international sales database (asyncpg)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    
+    parser.add_argument(
+        '--drop-existing',
+        action='store_true',
+        help='Drop existing database before creating'
+    )
+    
+    parser.add_argument(
+        '--populate-ref',
+        action='store_true',
+        help='Populate with basic reference data'
+    )
+    
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Enable verbose logging'
+    )
+    
+    parser.add_argument(
+        '--schema-file',
+        default='schema.sql',
+        help='Path to schema SQL file (default: schema.sql)'
+    )
+    
+    args = parser.parse_args()
+    
+    # Load configuration
+    config = get_config()
+    
+    # Validate configuration
+    if not config['password']:
+        print("Error: Database password not set. Check PGPASSWORD environment variable.")
+        sys.exit(1)
+    
+    print(f"Initializing database: {config['database']}")
+    print(f"Host: {config['host']}:{config['port']}")
+    print(f"User: {config['user']}")
+    print("=" * 50)
+    
+    try:
+        success = asyncio.run(run(args, config))
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        sys.exit(1)
+    
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""
+Database connection settings shared by the sales database scripts.
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, Any
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    print("Warning: python-dotenv not installed. Using environment variables directly.")
+    load_dotenv = None
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Dict[str, Any]:
+    """Load database configuration from the environment (and .env), once per process.
+    
+    The returned dict is shared between callers, so treat it as read-only.
+    """
+    if load_dotenv:
+        load_dotenv()
+    
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': int(os.getenv('DB_PORT', '5432')),
+        'database': os.getenv('DB_NAME', 'sales'),
+        'user': os.getenv('DB_USER', 'postgres'),
+        'password': os.getenv('PGPASSWORD', '')
+    }
@@ -72,7 +72,11 @@ class SalesDataGenerator:
             'employees': {},
             'products': {},
             'suppliers': {},
-            'customers': {}
+            'customers': {},
+            # Records that have their database id, appended as real_id is set
+            'products_realized': [],
+            'employees_realized': [],
+            'customers_realized': []
         }
         
         # Initialize generator modules
@@ -271,6 +275,12 @@ def main():
         help='Batch size for database inserts (default: 1000)'
     )
     
+    parser.add_argument(
+        '--parallel-po-threshold',
+        type=int,
+        help='Build purchase orders in worker processes from this many on (default: 2500)'
+    )
+    
     # Validation
     parser.add_argument(
         '--validate-only',
@@ -314,6 +324,8 @@ def main():
             config.purchase_orders = args.purchase_orders
         if args.batch_size:
             config.batch_size = args.batch_size
+        if args.parallel_po_threshold is not None:
+            config.parallel_po_threshold = args.parallel_po_threshold
         
         # Parse date range
         if args.date_range:
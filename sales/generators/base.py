@@ -1,14 +1,49 @@
+import io
+import csv
 import random
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+from typing import Dict, Iterable, Iterator, List, Any, Sequence, Tuple
 from faker import Faker
 from faker.providers import BaseProvider
 from datetime import datetime
-from psycopg2.extras import execute_batch
+from psycopg2.extensions import encodings
 
 from .config import GenerationConfig
 
 
+# Stand-in for territories missing from the lookup: orders and costs fall back to USD
+USD_TERRITORY = {'currency': 'USD'}
+
+# Rows per multi-row INSERT statement for bulk execute_values inserts
+VALUES_PAGE_SIZE = 10000
+
+# Rows CSV-encoded per chunk when streaming COPY data
+COPY_CHUNK_ROWS = 5000
+
+
+class IterStream(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks, so COPY can pull rows lazily."""
+    
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._pending = memoryview(b'')
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while not len(self._pending):
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
 class BusinessProvider(BaseProvider):
     """Custom Faker provider for business-specific data."""
     
@@ -68,6 +103,36 @@ class BaseGenerator:
         # Add custom provider to all fakers
         for fake in [self.fake_us, self.fake_uk, self.fake_de, self.fake_fr, self.fake_jp, self.fake_cn]:
             fake.add_provider(BusinessProvider)
+        
+        # Tuple snapshots of cached records for random.choice, rebuilt when the cache grows
+        self._territory_tuple = ()
+        self._supplier_tuple = ()
+    
+    @property
+    def territory_by_id(self) -> Dict[int, Dict[str, Any]]:
+        """Territories keyed by database id, built once and shared through the cache."""
+        if 'territory_by_id' not in self.cache:
+            self.cache['territory_by_id'] = {t['id']: t for t in self.cache['territories'].values() if 'id' in t}
+        return self.cache['territory_by_id']
+    
+    @property
+    def territory_tuple(self) -> Tuple[Dict[str, Any], ...]:
+        """All cached territories as a tuple; only rebuilt when territories have been added."""
+        if len(self._territory_tuple) != len(self.cache['territories']):
+            self._territory_tuple = tuple(self.cache['territories'].values())
+        return self._territory_tuple
+    
+    @property
+    def supplier_tuple(self) -> Tuple[Any, ...]:
+        """All cached suppliers as a tuple; only rebuilt when suppliers have been added."""
+        if len(self._supplier_tuple) != len(self.cache['suppliers']):
+            self._supplier_tuple = tuple(self.cache['suppliers'].values())
+        return self._supplier_tuple
+    
+    def _set_real_id(self, kind: str, record: Dict[str, Any], real_id: int) -> None:
+        """Record a database id on a cached record and add it to the `<kind>_realized` list."""
+        record['real_id'] = real_id
+        self.cache[f'{kind}_realized'].append(record)
     
     def _safe_faker_call(self, faker, method_name, fallback_value, *args, **kwargs):
         """Safely call a faker method with fallback if the method doesn't exist."""
@@ -91,4 +156,45 @@ class BaseGenerator:
             faker,
             'state',
             faker.city()  # Fallback to city if state() doesn't exist
-        )
\ No newline at end of file
+        )
+    
+    def _copy_rows(self, table: str, columns: List[str], rows: Iterable[Sequence]) -> None:
+        """Bulk-load rows into a table with COPY FROM STDIN (None values are written as NULL).
+        
+        Rows are CSV-encoded chunk by chunk as COPY reads them, so `rows` may be a generator
+        and memory stays bounded by COPY_CHUNK_ROWS rather than by the number of rows.
+        """
+        chunks = self._csv_chunks(rows, encodings[self.conn.encoding])
+        self.cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')",
+            IterStream(chunks)
+        )
+    
+    @staticmethod
+    def _csv_chunks(rows: Iterable[Sequence], encoding: str) -> Iterator[bytes]:
+        """Encode rows as CSV in chunks of COPY_CHUNK_ROWS rows."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        for count, row in enumerate(rows, start=1):
+            # NumPy scalars are unwrapped so floats are not written as e.g. np.float64(1.5)
+            writer.writerow([
+                '\\N' if value is None else value.item() if isinstance(value, np.generic) else value
+                for value in row
+            ])
+            if count % COPY_CHUNK_ROWS == 0:
+                yield buffer.getvalue().encode(encoding)
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode(encoding)
+    
+    def _restart_sequences(self, *sequences: str) -> None:
+        """Restart sequences at 1, sending all ALTER SEQUENCE statements in a single round trip."""
+        self.cursor.execute(" ".join(f"ALTER SEQUENCE {seq} RESTART WITH 1;" for seq in sequences))
+    
+    def _reserve_ids(self, sequence: str, count: int) -> List[int]:
+        """Reserve `count` ids from a sequence so rows can be written with known primary keys."""
+        if count == 0:
+            return []
+        self.cursor.execute("SELECT nextval(%s) FROM generate_series(1, %s);", (sequence, count))
+        return [row[0] for row in self.cursor.fetchall()]
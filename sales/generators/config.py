@@ -23,6 +23,11 @@ class GenerationConfig:
     # Database settings
     batch_size: int = 1000
     
+    # Purchase orders are built in worker processes from this many on (multi-core hosts only).
+    # Results are pickled back to the parent, which costs about a third of building them, so
+    # the pool pays off only once its ~30 ms startup is amortized over a few thousand orders
+    parallel_po_threshold: int = 2500
+    
     # Generation settings
     exchange_rate_days: int = 1461  # 4 years of daily rates (2022-2025)
     seasonal_factor: float = 0.3    # Sales seasonality strength
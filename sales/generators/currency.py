@@ -1,7 +1,7 @@
 import numpy as np
 from datetime import timedelta
-from psycopg2.extras import execute_batch
-from .base import BaseGenerator
+from psycopg2.extras import execute_values
+from .base import BaseGenerator, VALUES_PAGE_SIZE
 
 
 class CurrencyGenerator(BaseGenerator):
@@ -13,7 +13,7 @@ class CurrencyGenerator(BaseGenerator):
         
         # Reset exchange rates sequence to start from 1
         try:
-            self.cursor.execute("ALTER SEQUENCE exchange_rates_exchange_rate_id_seq RESTART WITH 1;")
+            self._restart_sequences('exchange_rates_exchange_rate_id_seq')
             self.conn.commit()
             self.logger.debug("Reset exchange_rate_id sequence to start from 1")
         except Exception as e:
@@ -44,9 +44,9 @@ class CurrencyGenerator(BaseGenerator):
         ]
         
         # Insert currencies
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO currencies (currency_code, name, symbol) VALUES (%s, %s, %s) ON CONFLICT (currency_code) DO NOTHING;",
+            "INSERT INTO currencies (currency_code, name, symbol) VALUES %s ON CONFLICT (currency_code) DO NOTHING;",
             currencies_data,
             page_size=self.config.batch_size
         )
@@ -125,21 +125,23 @@ class CurrencyGenerator(BaseGenerator):
             
             # Batch insert to avoid memory issues
             if len(exchange_rates) >= 10000:
-                execute_batch(
+                execute_values(
                     self.cursor,
-                    "INSERT INTO exchange_rates (from_currency, to_currency, rate, effective_date) VALUES (%s, %s, %s, %s) ON CONFLICT (from_currency, to_currency, effective_date) DO NOTHING;",
+                    "INSERT INTO exchange_rates (from_currency, to_currency, rate, effective_date) VALUES %s ON CONFLICT (from_currency, to_currency, effective_date) DO NOTHING;",
                     exchange_rates,
-                    page_size=self.config.batch_size
+                    template="(%s, %s, %s, %s::date)",
+                    page_size=VALUES_PAGE_SIZE
                 )
                 exchange_rates = []
         
         # Insert remaining rates
         if exchange_rates:
-            execute_batch(
+            execute_values(
                 self.cursor,
-                "INSERT INTO exchange_rates (from_currency, to_currency, rate, effective_date) VALUES (%s, %s, %s, %s) ON CONFLICT (from_currency, to_currency, effective_date) DO NOTHING;",
+                "INSERT INTO exchange_rates (from_currency, to_currency, rate, effective_date) VALUES %s ON CONFLICT (from_currency, to_currency, effective_date) DO NOTHING;",
                 exchange_rates,
-                page_size=self.config.batch_size
+                template="(%s, %s, %s, %s::date)",
+                page_size=VALUES_PAGE_SIZE
             )
         
         self.conn.commit()
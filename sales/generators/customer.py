@@ -1,6 +1,6 @@
 import random
-from psycopg2.extras import execute_batch
-from .base import BaseGenerator
+from psycopg2.extras import execute_values
+from .base import BaseGenerator, VALUES_PAGE_SIZE
 
 
 class CustomerGenerator(BaseGenerator):
@@ -12,9 +12,11 @@ class CustomerGenerator(BaseGenerator):
         
         # Reset customer sequences to start from 1
         try:
-            self.cursor.execute("ALTER SEQUENCE customers_customer_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE customer_addresses_customer_address_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE shipping_methods_shipping_method_id_seq RESTART WITH 1;")
+            self._restart_sequences(
+                'customers_customer_id_seq',
+                'customer_addresses_customer_address_id_seq',
+                'shipping_methods_shipping_method_id_seq'
+            )
             self.conn.commit()
             self.logger.debug("Reset customer-related sequences to start from 1")
         except Exception as e:
@@ -27,7 +29,7 @@ class CustomerGenerator(BaseGenerator):
         # Generate additional customer addresses
         new_addresses = []
         for _ in range(self.config.customers):
-            territory = random.choice(list(self.cache['territories'].values()))
+            territory = random.choice(self.territory_tuple)
             if 'id' not in territory:
                 continue
                 
@@ -56,11 +58,12 @@ class CustomerGenerator(BaseGenerator):
                 for addr in new_addresses
             ]
             
-            execute_batch(
+            execute_values(
                 self.cursor,
-                "INSERT INTO addresses (address_line1, address_line2, city, postal_code, territory_id, country_id) VALUES (%s, %s, %s, %s, %s, %s);",
+                "INSERT INTO addresses (address_line1, address_line2, city, postal_code, territory_id, country_id) VALUES %s;",
                 addresses_insert,
-                page_size=self.config.batch_size
+                template="(%s, %s, %s, %s, %s, %s)",
+                page_size=VALUES_PAGE_SIZE
             )
         
         # Get all addresses
@@ -75,7 +78,7 @@ class CustomerGenerator(BaseGenerator):
         
         for customer_id in range(1, self.config.customers + 1):
             # Choose territory for customer locale
-            territory = random.choice(list(self.cache['territories'].values()))
+            territory = random.choice(self.territory_tuple)
             if 'id' not in territory:
                 continue
                 
@@ -155,11 +158,12 @@ class CustomerGenerator(BaseGenerator):
             for cust in customers
         ]
         
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO customers (company_name, tax_id, contact_name, contact_email, contact_phone, credit_limit, credit_terms) VALUES (%s, %s, %s, %s, %s, %s, %s);",
+            "INSERT INTO customers (company_name, tax_id, contact_name, contact_email, contact_phone, credit_limit, credit_terms) VALUES %s;",
             customers_insert,
-            page_size=self.config.batch_size
+            template="(%s, %s, %s, %s, %s, %s, %s)",
+            page_size=VALUES_PAGE_SIZE
         )
         
         # Get real customer IDs
@@ -169,7 +173,7 @@ class CustomerGenerator(BaseGenerator):
         for cust in customers:
             real_id = customer_name_to_id.get(cust['company_name'])
             if real_id:
-                cust['real_id'] = real_id
+                self._set_real_id('customers', cust, real_id)
         
         # Insert customer addresses
         customer_addresses_insert = [
@@ -178,11 +182,12 @@ class CustomerGenerator(BaseGenerator):
             if customers[ca[0]-1]['company_name'] in customer_name_to_id
         ]
         
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO customer_addresses (customer_id, address_id, address_type, is_primary) VALUES (%s, %s, %s, %s);",
+            "INSERT INTO customer_addresses (customer_id, address_id, address_type, is_primary) VALUES %s;",
             customer_addresses_insert,
-            page_size=self.config.batch_size
+            template="(%s, %s, %s, %s)",
+            page_size=VALUES_PAGE_SIZE
         )
         
         # Generate shipping methods
@@ -195,9 +200,9 @@ class CustomerGenerator(BaseGenerator):
             ('Freight', 'Various', 10, 'WEIGHT', 2.50, 'USD')
         ]
         
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO shipping_methods (method_name, carrier, estimated_days, cost_calculation_type, base_cost, currency_code) VALUES (%s, %s, %s, %s, %s, %s) ON CONFLICT DO NOTHING;",
+            "INSERT INTO shipping_methods (method_name, carrier, estimated_days, cost_calculation_type, base_cost, currency_code) VALUES %s ON CONFLICT DO NOTHING;",
             shipping_methods,
             page_size=self.config.batch_size
         )
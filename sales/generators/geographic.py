@@ -1,6 +1,6 @@
 import random
-from psycopg2.extras import execute_batch
-from .base import BaseGenerator
+from psycopg2.extras import execute_values
+from .base import BaseGenerator, VALUES_PAGE_SIZE
 
 
 class GeographicGenerator(BaseGenerator):
@@ -12,9 +12,11 @@ class GeographicGenerator(BaseGenerator):
         
         # Reset sequences to start from 1
         try:
-            self.cursor.execute("ALTER SEQUENCE countries_country_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE territories_territory_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE addresses_address_id_seq RESTART WITH 1;")
+            self._restart_sequences(
+                'countries_country_id_seq',
+                'territories_territory_id_seq',
+                'addresses_address_id_seq'
+            )
             self.conn.commit()
             self.logger.debug("Reset geographic sequences to start from 1")
         except Exception as e:
@@ -82,9 +84,9 @@ class GeographicGenerator(BaseGenerator):
                 'currency': currency, 'faker': faker
             }
         
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO countries (name, code, region, currency_code) VALUES (%s, %s, %s, %s) ON CONFLICT (name) DO NOTHING;",
+            "INSERT INTO countries (name, code, region, currency_code) VALUES %s ON CONFLICT (name) DO NOTHING;",
             countries_insert,
             page_size=self.config.batch_size
         )
@@ -167,11 +169,12 @@ class GeographicGenerator(BaseGenerator):
             if len(territories_insert) >= self.config.territories:
                 break
         
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO territories (name, country_id) VALUES (%s, %s);",
+            "INSERT INTO territories (name, country_id) VALUES %s;",
             territories_insert,
-            page_size=self.config.batch_size
+            template="(%s, %s)",
+            page_size=VALUES_PAGE_SIZE
         )
         
         # Get territory IDs
@@ -185,6 +188,7 @@ class GeographicGenerator(BaseGenerator):
             real_id = territory_lookup.get((territory_info['name'], territory_info['country_id']))
             if real_id:
                 territory_info['id'] = real_id
+        self.cache.pop('territory_by_id', None)  # Rebuilt from the real ids on next use
         
         self.conn.commit()
         self.logger.info(f"Generated {len(countries_insert)} countries and {len(territories_insert)} territories")
\ No newline at end of file
@@ -1,8 +1,8 @@
 import random
 import numpy as np
 from datetime import timedelta
-from psycopg2.extras import execute_batch
-from .base import BaseGenerator
+from psycopg2.extras import execute_values
+from .base import BaseGenerator, VALUES_PAGE_SIZE
 
 
 class HRGenerator(BaseGenerator):
@@ -14,8 +14,10 @@ class HRGenerator(BaseGenerator):
         
         # Reset HR-related sequences to start from 1
         try:
-            self.cursor.execute("ALTER SEQUENCE roles_role_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE employees_employee_id_seq RESTART WITH 1;")
+            self._restart_sequences(
+                'roles_role_id_seq',
+                'employees_employee_id_seq'
+            )
             self.conn.commit()
             self.logger.debug("Reset HR-related sequences to start from 1")
         except Exception as e:
@@ -34,9 +36,9 @@ class HRGenerator(BaseGenerator):
         ]
         
         # Insert roles if they don't exist
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO roles (name, description) VALUES (%s, %s) ON CONFLICT (name) DO NOTHING;",
+            "INSERT INTO roles (name, description) VALUES %s ON CONFLICT (name) DO NOTHING;",
             required_roles,
             page_size=self.config.batch_size
         )
@@ -56,7 +58,7 @@ class HRGenerator(BaseGenerator):
         used_emails = set()
         
         # Create CEO first
-        ceo_territory = random.choice(list(self.cache['territories'].values()))
+        ceo_territory = random.choice(self.territory_tuple)
         faker = ceo_territory['faker']
         
         ceo_email = faker.email()
@@ -142,7 +144,7 @@ class HRGenerator(BaseGenerator):
         
         for _ in range(remaining_slots):
             # Choose territory
-            territory = random.choice(list(self.cache['territories'].values()))
+            territory = random.choice(self.territory_tuple)
             if 'id' not in territory:
                 continue
                 
@@ -216,11 +218,12 @@ class HRGenerator(BaseGenerator):
             None, ceo['salary'], ceo['salary_currency'], ceo['hire_date']
         )]
         
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO employees (name, email, role_id, territory_id, manager_id, salary, salary_currency_code, hire_date) VALUES (%s, %s, %s, %s, %s, %s, %s, %s);",
+            "INSERT INTO employees (name, email, role_id, territory_id, manager_id, salary, salary_currency_code, hire_date) VALUES %s;",
             ceo_insert,
-            page_size=self.config.batch_size
+            template="(%s, %s, %s, %s, %s, %s, %s, %s)",
+            page_size=VALUES_PAGE_SIZE
         )
         
         # Get CEO's real database ID
@@ -240,11 +243,12 @@ class HRGenerator(BaseGenerator):
                 for mgr in managers
             ]
             
-            execute_batch(
+            execute_values(
                 self.cursor,
-                "INSERT INTO employees (name, email, role_id, territory_id, manager_id, salary, salary_currency_code, hire_date) VALUES (%s, %s, %s, %s, %s, %s, %s, %s);",
+                "INSERT INTO employees (name, email, role_id, territory_id, manager_id, salary, salary_currency_code, hire_date) VALUES %s;",
                 managers_insert,
-                page_size=self.config.batch_size
+                template="(%s, %s, %s, %s, %s, %s, %s, %s)",
+                page_size=VALUES_PAGE_SIZE
             )
         
         # Get manager real IDs
@@ -276,11 +280,12 @@ class HRGenerator(BaseGenerator):
                 for emp in other_employees
             ]
             
-            execute_batch(
+            execute_values(
                 self.cursor,
-                "INSERT INTO employees (name, email, role_id, territory_id, manager_id, salary, salary_currency_code, hire_date) VALUES (%s, %s, %s, %s, %s, %s, %s, %s);",
+                "INSERT INTO employees (name, email, role_id, territory_id, manager_id, salary, salary_currency_code, hire_date) VALUES %s;",
                 other_employees_insert,
-                page_size=self.config.batch_size
+                template="(%s, %s, %s, %s, %s, %s, %s, %s)",
+                page_size=VALUES_PAGE_SIZE
             )
         
         # Update cache with real employee IDs for all employees
@@ -290,7 +295,7 @@ class HRGenerator(BaseGenerator):
         for emp in employees:
             real_id = email_to_id.get(emp['email'])
             if real_id:
-                emp['real_id'] = real_id
+                self._set_real_id('employees', emp, real_id)
         
         self.conn.commit()
         self.logger.info(f"Generated {len(employees)} employees with hierarchy")
\ No newline at end of file
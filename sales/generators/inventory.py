@@ -1,6 +1,6 @@
 import random
-from psycopg2.extras import execute_batch
-from .base import BaseGenerator
+from psycopg2.extras import execute_values
+from .base import BaseGenerator, USD_TERRITORY, VALUES_PAGE_SIZE
 
 
 class InventoryGenerator(BaseGenerator):
@@ -12,13 +12,13 @@ class InventoryGenerator(BaseGenerator):
         
         # Reset inventory sequence to start from 1
         try:
-            self.cursor.execute("ALTER SEQUENCE inventory_inventory_id_seq RESTART WITH 1;")
+            self._restart_sequences('inventory_inventory_id_seq')
             self.conn.commit()
             self.logger.debug("Reset inventory_id sequence to start from 1")
         except Exception as e:
             self.logger.warning(f"Could not reset inventory sequence: {e}")
         
-        products_with_ids = [p for p in self.cache['products'].values() if 'real_id' in p]
+        products_with_ids = self.cache['products_realized']
         territories_with_ids = [t for t in self.cache['territories'].values() if 'id' in t]
         
         inventory_records = []
@@ -71,33 +71,29 @@ class InventoryGenerator(BaseGenerator):
             for inv in inventory_records
         ]
         
-        execute_batch(
+        execute_values(
             self.cursor,
             """INSERT INTO inventory (product_id, territory_id, quantity_on_hand, quantity_on_order, 
                  quantity_reserved, reorder_level, max_stock_level) 
-                 VALUES (%s, %s, %s, %s, %s, %s, %s) 
+                 VALUES %s 
                  ON CONFLICT (product_id, territory_id) DO NOTHING;""",
             inventory_insert,
-            page_size=self.config.batch_size
+            template="(%s, %s, %s, %s, %s, %s, %s)",
+            page_size=VALUES_PAGE_SIZE
         )
         
         # Generate sales targets for employees
         self.logger.info("Generating sales targets...")
         
-        # Create territory lookup by real database ID
-        territory_lookup = {}
-        for territory_info in self.cache['territories'].values():
-            if 'id' in territory_info:
-                territory_lookup[territory_info['id']] = territory_info
+        territory_lookup = self.territory_by_id
         
         sales_targets = []
-        sales_employees = [e for e in self.cache['employees'].values() 
-                          if 'real_id' in e and 'Sales' in str(e.get('role_id', ''))]
+        sales_employees = [e for e in self.cache['employees_realized'] if 'Sales' in str(e.get('role_id', ''))]
         
         for employee in sales_employees:
             # Annual targets for current and next year
             for target_year in [self.config.end_date.year, self.config.end_date.year + 1]:
-                territory_currency = territory_lookup.get(employee['territory_id'], {}).get('currency', 'USD')
+                territory_currency = territory_lookup.get(employee['territory_id'], USD_TERRITORY)['currency']
                 
                 # Target amount based on employee level and territory
                 base_target = random.uniform(100000, 1000000)
@@ -121,13 +117,14 @@ class InventoryGenerator(BaseGenerator):
                 for st in sales_targets
             ]
             
-            execute_batch(
+            execute_values(
                 self.cursor,
                 """INSERT INTO sales_targets (employee_id, territory_id, target_year, target_period_type, 
                      target_period_value, target_amount, target_currency_code) 
-                     VALUES (%s, %s, %s, %s, %s, %s, %s);""",
+                     VALUES %s;""",
                 targets_insert,
-                page_size=self.config.batch_size
+                template="(%s, %s, %s, %s, %s, %s, %s)",
+                page_size=VALUES_PAGE_SIZE
             )
         
         self.conn.commit()
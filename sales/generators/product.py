@@ -1,7 +1,7 @@
 import random
 import json
-from psycopg2.extras import execute_batch
-from .base import BaseGenerator
+from psycopg2.extras import execute_values
+from .base import BaseGenerator, VALUES_PAGE_SIZE
 
 
 class ProductGenerator(BaseGenerator):
@@ -13,11 +13,13 @@ class ProductGenerator(BaseGenerator):
         
         # Reset product sequences to start from 1
         try:
-            self.cursor.execute("ALTER SEQUENCE product_categories_category_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE products_product_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE cost_types_cost_type_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE product_costs_product_cost_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE product_prices_price_id_seq RESTART WITH 1;")
+            self._restart_sequences(
+                'product_categories_category_id_seq',
+                'products_product_id_seq',
+                'cost_types_cost_type_id_seq',
+                'product_costs_product_cost_id_seq',
+                'product_prices_price_id_seq'
+            )
             self.conn.commit()
             self.logger.debug("Reset product-related sequences to start from 1")
         except Exception as e:
@@ -120,11 +122,12 @@ class ProductGenerator(BaseGenerator):
                 for cat in root_categories
             ]
             
-            execute_batch(
+            execute_values(
                 self.cursor,
-                "INSERT INTO product_categories (name, parent_category, description) VALUES (%s, %s, %s);",
+                "INSERT INTO product_categories (name, parent_category, description) VALUES %s;",
                 root_insert,
-                page_size=self.config.batch_size
+                template="(%s, %s, %s)",
+                page_size=VALUES_PAGE_SIZE
             )
         
         # Get root category real IDs
@@ -169,11 +172,12 @@ class ProductGenerator(BaseGenerator):
                 for cat in ready_to_insert
             ]
             
-            execute_batch(
+            execute_values(
                 self.cursor,
-                "INSERT INTO product_categories (name, parent_category, description) VALUES (%s, %s, %s);",
+                "INSERT INTO product_categories (name, parent_category, description) VALUES %s;",
                 level_insert,
-                page_size=self.config.batch_size
+                template="(%s, %s, %s)",
+                page_size=VALUES_PAGE_SIZE
             )
             
             # Get the real IDs for this level
@@ -267,11 +271,12 @@ class ProductGenerator(BaseGenerator):
             for prod in products
         ]
         
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO products (name, sku, category_id, specifications) VALUES (%s, %s, %s, %s);",
+            "INSERT INTO products (name, sku, category_id, specifications) VALUES %s;",
             products_insert,
-            page_size=self.config.batch_size
+            template="(%s, %s, %s, %s)",
+            page_size=VALUES_PAGE_SIZE
         )
         
         # Get real product IDs
@@ -281,7 +286,7 @@ class ProductGenerator(BaseGenerator):
         for prod in products:
             real_id = sku_to_id.get(prod['sku'])
             if real_id:
-                prod['real_id'] = real_id
+                self._set_real_id('products', prod, real_id)
         
         # Generate product prices
         self.logger.info("Generating product prices...")
@@ -297,9 +302,9 @@ class ProductGenerator(BaseGenerator):
             ('OVERHEAD', 'General Overhead')
         ]
         
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO cost_types (name, description) VALUES (%s, %s) ON CONFLICT (name) DO NOTHING;",
+            "INSERT INTO cost_types (name, description) VALUES %s ON CONFLICT (name) DO NOTHING;",
             required_cost_types,
             page_size=self.config.batch_size
         )
@@ -380,18 +385,20 @@ class ProductGenerator(BaseGenerator):
             costs.append((real_id, cost_types['DUTIES'], round(duties_cost, 2), 'USD', self.config.start_date, None))
         
         # Insert prices and costs
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO product_prices (product_id, currency_code, price, effective_date, end_date) VALUES (%s, %s, %s, %s, %s);",
+            "INSERT INTO product_prices (product_id, currency_code, price, effective_date, end_date) VALUES %s;",
             prices,
-            page_size=self.config.batch_size
+            template="(%s, %s, %s, %s::date, %s::date)",
+            page_size=VALUES_PAGE_SIZE
         )
         
-        execute_batch(
+        execute_values(
             self.cursor,
-            "INSERT INTO product_costs (product_id, cost_type_id, amount, currency_code, effective_date, end_date) VALUES (%s, %s, %s, %s, %s, %s);",
+            "INSERT INTO product_costs (product_id, cost_type_id, amount, currency_code, effective_date, end_date) VALUES %s;",
             costs,
-            page_size=self.config.batch_size
+            template="(%s, %s, %s, %s, %s::date, %s::date)",
+            page_size=VALUES_PAGE_SIZE
         )
         
         self.conn.commit()
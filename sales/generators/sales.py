@@ -1,8 +1,24 @@
 import random
 import numpy as np
 from datetime import timedelta, date, datetime
-from psycopg2.extras import execute_batch
-from .base import BaseGenerator
+from typing import Any, Dict, List
+from .base import BaseGenerator, USD_TERRITORY
+
+
+ORDER_COLUMNS = [
+    'order_id', 'order_number', 'customer_id', 'employee_id', 'order_date', 'requested_delivery_date',
+    'shipped_date', 'payment_due_date', 'status', 'subtotal_amount', 'tax_amount', 'shipping_cost',
+    'grand_total_amount', 'billing_address_id', 'shipping_address_id', 'shipping_method_id',
+    'tracking_number', 'currency_code', 'notes'
+]
+
+ORDER_DETAIL_COLUMNS = [
+    'order_id', 'product_id', 'quantity', 'unit_price', 'discount_percentage',
+    'final_unit_price', 'line_item_tax_amount'
+]
+
+# Approximate USD conversion used when a product has no price in the order currency
+USD_CONVERSION = {'EUR': 0.85, 'GBP': 0.75, 'JPY': 110, 'CAD': 1.25}
 
 
 class SalesGenerator(BaseGenerator):
@@ -14,18 +30,21 @@ class SalesGenerator(BaseGenerator):
         
         # Reset sales order sequences to start from 1
         try:
-            self.cursor.execute("ALTER SEQUENCE orders_order_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE order_details_order_detail_id_seq RESTART WITH 1;")
+            self._restart_sequences(
+                'orders_order_id_seq',
+                'order_details_order_detail_id_seq'
+            )
             self.conn.commit()
             self.logger.debug("Reset sales order sequences to start from 1")
         except Exception as e:
             self.logger.warning(f"Could not reset order sequences: {e}")
+            self.conn.rollback()
         
         try:
             # Get necessary data
-            customers_with_ids = [c for c in self.cache['customers'].values() if 'real_id' in c]
-            employees_with_ids = [e for e in self.cache['employees'].values() if 'real_id' in e]
-            products_with_ids = [p for p in self.cache['products'].values() if 'real_id' in p]
+            customers_with_ids = self.cache['customers_realized']
+            employees_with_ids = self.cache['employees_realized']
+            products_with_ids = self.cache['products_realized']
             
             self.logger.info(f"Available for sales generation: {len(customers_with_ids)} customers, {len(employees_with_ids)} employees, {len(products_with_ids)} products")
             
@@ -39,13 +58,8 @@ class SalesGenerator(BaseGenerator):
                 self.logger.error("No products with real IDs found for sales generation")
                 return
             
-            # Create territory lookup by real database ID
-            territory_lookup = {}
-            for territory_info in self.cache['territories'].values():
-                if 'id' in territory_info:
-                    territory_lookup[territory_info['id']] = territory_info
-            
-            self.logger.info(f"Built territory lookup for {len(territory_lookup)} territories")
+            territory_lookup = self.territory_by_id
+            self.logger.info(f"Using territory lookup for {len(territory_lookup)} territories")
         
         except Exception as e:
             self.logger.error(f"Error during sales data preparation: {e}")
@@ -64,277 +78,365 @@ class SalesGenerator(BaseGenerator):
             
             if not addresses:
                 self.logger.error("No addresses found for order generation")
+                self.conn.rollback()
                 return
         
         except Exception as e:
             self.logger.error(f"Error fetching shipping methods or addresses: {e}")
+            self.conn.rollback()
             raise
         
-        orders = []
-        order_details = []
-        used_order_numbers = set()
+        # Orders are generated and written in batches of batch_size (see the order loop below)
+        pending_orders = []
+        orders_written = 0
+        lines_written = 0
+        
+        # Draw unique order numbers once, tracking duplicates by hash rather than by string;
+        # any shortfall is topped up with sequential numbers
+        order_numbers = []
+        seen_hashes = set()
+        for _ in range(int(self.config.sales_orders * 1.2)):
+            if len(order_numbers) == self.config.sales_orders:
+                break
+            order_number = self.fake_us.order_number()
+            number_hash = hash(order_number)
+            if number_hash not in seen_hashes:
+                seen_hashes.add(number_hash)
+                order_numbers.append(order_number)
+        del seen_hashes
+        current_year = datetime.now().year
+        order_numbers.extend(
+            f"SO-{current_year}-{n:06d}" for n in range(len(order_numbers) + 1, self.config.sales_orders + 1)
+        )
+        
+        # Column arrays for the customer, employee and product fields used per order
+        cust_real_id = np.fromiter((c['real_id'] for c in customers_with_ids), dtype=np.int64, count=len(customers_with_ids))
+        cust_credit_limit = np.fromiter((c.get('credit_limit', 0) for c in customers_with_ids), dtype=np.float64, count=len(customers_with_ids))
+        cust_credit_terms = np.fromiter((c['credit_terms'] for c in customers_with_ids), dtype=np.int64, count=len(customers_with_ids))
+        cust_company_name = np.array([c['company_name'] for c in customers_with_ids])
+        
+        # Order currency follows the customer's territory, falling back to USD
+        cust_currency = np.array([
+            territory_lookup.get(c.get('territory_id'), USD_TERRITORY)['currency'] for c in customers_with_ids
+        ])
+        unknown_territories = sum(1 for c in customers_with_ids if c.get('territory_id') not in territory_lookup)
+        if unknown_territories:
+            self.logger.warning(f"Territory not found for {unknown_territories} customers, using USD")
+        
+        emp_real_id = np.fromiter((e['real_id'] for e in employees_with_ids), dtype=np.int64, count=len(employees_with_ids))
+        prod_real_id = np.fromiter((p['real_id'] for p in products_with_ids), dtype=np.int64, count=len(products_with_ids))
+        
+        # Order sampling constants shared by every batch; timedelta objects are built once and reused
+        rng = np.random.default_rng()
+        max_lines = min(10, len(products_with_ids))
+        span_days = (self.config.end_date - self.config.start_date).days
+        day_offsets = {k: timedelta(days=k) for k in range(1, 22)}
+        payment_term_offsets = {t: timedelta(days=t) for t in set(cust_credit_terms.tolist())}
+        recent_cutoff = date.today() - timedelta(days=7)
+        
+        # The orders are written in one transaction committed once at the end; skipping the
+        # WAL flush wait is safe for a bulk load that can simply be rerun. SET LOCAL ends with
+        # the transaction, so every exit below commits or rolls back.
+        self.cursor.execute("SET LOCAL synchronous_commit = off;")
         
         # Generate orders with seasonal patterns
         try:
             self.logger.info(f"Starting generation of {self.config.sales_orders} sales orders")
             
-            for order_num in range(1, self.config.sales_orders + 1):
-                if order_num % 1000 == 0:
-                    self.logger.info(f"Generated {order_num} orders so far...")
-                
-                try:
-                    # Choose customer and sales rep
-                    customer = random.choice(customers_with_ids)
-                    employee = random.choice(employees_with_ids)
-                    
-                    # Generate order date with seasonality
-                    # Q4 has higher volume, summer months are slower
-                    order_date = self.fake_us.date_between(
-                        start_date=self.config.start_date,
-                        end_date=self.config.end_date
-                    )
-                    
-                    # Apply seasonal factor
-                    month = order_date.month
-                    if month in [11, 12]:  # Q4 boost
-                        seasonal_multiplier = 1.4
-                    elif month in [1, 2]:  # Post-holiday slowdown
-                        seasonal_multiplier = 0.7
-                    elif month in [6, 7, 8]:  # Summer slowdown
-                        seasonal_multiplier = 0.8
-                    else:
-                        seasonal_multiplier = 1.0
-                    
-                    # Skip some orders based on seasonality (create realistic volume patterns)
-                    if random.random() > seasonal_multiplier:
-                        continue
-                    
-                    # Order details
-                    billing_address = random.choice(addresses)
-                    shipping_address = random.choice(addresses)
-                    shipping_method = random.choice(shipping_methods) if shipping_methods else None
-                    
-                    # Currency based on customer territory - safely get with fallback
-                    territory_id = customer.get('territory_id')
-                    if territory_id in territory_lookup:
-                        currency = territory_lookup[territory_id]['currency']
-                    else:
-                        self.logger.warning(f"Territory {territory_id} not found for customer {customer.get('real_id', 'unknown')}, using USD")
-                        currency = 'USD'
+            # Bound methods for the per-order loop
+            _random, _choice = random.random, random.choice
             
-                    # Generate order lines
-                    num_lines = np.random.poisson(self.config.avg_order_lines)
-                    num_lines = max(1, min(num_lines, 10))  # 1-10 lines per order
-                    
-                    order_products = random.sample(products_with_ids, min(num_lines, len(products_with_ids)))
-            
-                    subtotal = 0
-                    order_line_details = []
+            # Per-order values are drawn one batch of batch_size orders at a time and the batch is
+            # written before the next is drawn, so memory is bounded by the batch size
+            for batch_start in range(0, self.config.sales_orders, self.config.batch_size):
+                batch_orders = min(self.config.batch_size, self.config.sales_orders - batch_start)
+                
+                # Customers, sales reps, line counts and product picks for every order of the batch
+                cust_idx = rng.integers(0, len(customers_with_ids), batch_orders)
+                emp_idx = rng.integers(0, len(employees_with_ids), batch_orders)
+                lines_per_order = np.clip(rng.poisson(self.config.avg_order_lines, batch_orders), 1, max_lines)
+                product_picks = self._sample_product_indices(rng, lines_per_order, len(products_with_ids), max_lines)
+                line_product_ids = prod_real_id[product_picks]
+                
+                # Quantity range by customer size (credit limit tiers) and volume discount by quantity,
+                # drawn for every (order, line) slot without per-line branching
+                credit_tier = np.searchsorted([25000, 100000], cust_credit_limit[cust_idx])
+                qty_low = np.array([1, 2, 5])[credit_tier]
+                qty_high = np.array([10, 20, 50])[credit_tier]
+                line_shape = product_picks.shape
+                line_quantities = rng.integers(qty_low[:, None], qty_high[:, None] + 1, size=line_shape)
+                line_discounts = np.where(
+                    line_quantities > 20, rng.uniform(5, 15, line_shape),
+                    np.where(line_quantities > 10, rng.uniform(2, 8, line_shape), rng.uniform(0, 5, line_shape))
+                )
+                
+                # Tracking numbers (used only for shipped orders) and order notes, built as string arrays
+                tracking_numbers = np.char.add("TRK", rng.integers(100000000, 1000000000, batch_orders).astype(str))
+                order_notes = np.char.add("Order for ", cust_company_name[cust_idx])
+                
+                # Order dates and day offsets
+                order_day_offsets = rng.integers(0, span_days + 1, batch_orders)
+                order_dates = (np.datetime64(self.config.start_date, 'D') + order_day_offsets).astype(object)
+                ship_days = rng.integers(1, 8, batch_orders)
+                delivery_days = rng.integers(7, 22, batch_orders)
+                
+                # Unit prices for every (order, line) slot, resolved against product_prices loaded once
+                order_ordinals = self.config.start_date.toordinal() + order_day_offsets
+                line_prices = self._resolve_line_prices(rng, line_product_ids, cust_currency[cust_idx], order_ordinals)
+                
+                # Line and order amounts for the whole batch at once; slots past an order's line count are masked out
+                line_mask = np.arange(max_lines) < lines_per_order[:, None]
+                line_final_prices = line_prices * (1 - line_discounts / 100)
+                line_totals = line_final_prices * line_quantities
+                line_taxes = line_totals * rng.uniform(0.05, 0.15, line_shape)  # 5-15% tax (simplified)
+                
+                # Monetary values are rounded once per array; order tax is the sum of the rounded line taxes
+                for amounts in (line_prices, line_discounts, line_final_prices, line_taxes):
+                    np.round(amounts, 2, out=amounts)
+                subtotals = np.where(line_mask, line_totals, 0).sum(axis=1)
+                total_taxes = np.where(line_mask, line_taxes, 0).sum(axis=1)
+                if shipping_methods:
+                    shipping_costs = rng.uniform(10, 100, batch_orders)
+                else:
+                    shipping_costs = np.zeros(batch_orders)
+                grand_totals = subtotals + total_taxes + shipping_costs
+                for amounts in (subtotals, total_taxes, shipping_costs, grand_totals):
+                    np.round(amounts, 2, out=amounts)
+                subtotals, total_taxes, shipping_costs, grand_totals = (
+                    subtotals.tolist(), total_taxes.tolist(), shipping_costs.tolist(), grand_totals.tolist()
+                )
+                
+                for k in range(batch_orders):
+                    order_num = batch_start + k + 1
+                    if order_num % 1000 == 0:
+                        self.logger.info(f"Generated {order_num} orders so far...")
                     
-                    for product in order_products:
-                        # Get product price in order currency
-                        self.cursor.execute("""
-                            SELECT price FROM product_prices 
-                            WHERE product_id = %s AND currency_code = %s 
-                            AND (end_date IS NULL OR end_date > %s)
-                            ORDER BY effective_date DESC LIMIT 1
-                        """, (product['real_id'], currency, order_date))
+                    try:
+                        # Customer and sales rep (pre-drawn above)
+                        i = cust_idx[k]
+                        customer_id = int(cust_real_id[i])
+                        payment_terms = payment_term_offsets[cust_credit_terms[i]]
+                        employee_id = int(emp_real_id[emp_idx[k]])
                         
-                        price_result = self.cursor.fetchone()
-                        if not price_result:
-                            # Fallback to USD price with approximate conversion
-                            self.cursor.execute("""
-                                SELECT price FROM product_prices 
-                                WHERE product_id = %s AND currency_code = 'USD'
-                                AND (end_date IS NULL OR end_date > %s)
-                                ORDER BY effective_date DESC LIMIT 1
-                            """, (product['real_id'], order_date))
-                            
-                            usd_price_result = self.cursor.fetchone()
-                            if usd_price_result:
-                                unit_price = float(usd_price_result[0])
-                                # Simple conversion (in real system, use exchange rates)
-                                if currency == 'EUR':
-                                    unit_price *= 0.85
-                                elif currency == 'GBP':
-                                    unit_price *= 0.75
-                                elif currency == 'JPY':
-                                    unit_price *= 110
-                                elif currency == 'CAD':
-                                    unit_price *= 1.25
-                            else:
-                                unit_price = random.uniform(50, 1000)  # Fallback
-                        else:
-                            unit_price = float(price_result[0])
-                        
-                        # Quantity based on customer type and product
-                        if customer.get('credit_limit', 0) > 100000:  # Large customer
-                            quantity = random.randint(5, 50)
-                        elif customer.get('credit_limit', 0) > 25000:  # Medium customer
-                            quantity = random.randint(2, 20)
-                        else:  # Small customer
-                            quantity = random.randint(1, 10)
+                        # Generate order date with seasonality
+                        # Q4 has higher volume, summer months are slower
+                        order_date = order_dates[k]
                         
-                        # Discount (volume discounts for larger orders)
-                        if quantity > 20:
-                            discount_pct = random.uniform(5, 15)
-                        elif quantity > 10:
-                            discount_pct = random.uniform(2, 8)
+                        # Apply seasonal factor
+                        month = order_date.month
+                        if month in [11, 12]:  # Q4 boost
+                            seasonal_multiplier = 1.4
+                        elif month in [1, 2]:  # Post-holiday slowdown
+                            seasonal_multiplier = 0.7
+                        elif month in [6, 7, 8]:  # Summer slowdown
+                            seasonal_multiplier = 0.8
                         else:
-                            discount_pct = random.uniform(0, 5)
+                            seasonal_multiplier = 1.0
                         
-                        final_unit_price = unit_price * (1 - discount_pct / 100)
-                        line_total = final_unit_price * quantity
+                        # Skip some orders based on seasonality (create realistic volume patterns)
+                        if _random() > seasonal_multiplier:
+                            continue
                         
-                        # Calculate line-level tax (simplified)
-                        tax_rate = random.uniform(0.05, 0.15)  # 5-15% tax
-                        line_tax = line_total * tax_rate
+                        # Order details
+                        billing_address = _choice(addresses)
+                        shipping_address = _choice(addresses)
+                        shipping_method = _choice(shipping_methods) if shipping_methods else None
                         
-                        subtotal += line_total
+                        currency = str(cust_currency[i])
+                
+                        # Generate order lines (1-10 distinct products per order, pre-drawn above)
+                        num_lines = lines_per_order[k]
+                        order_product_ids = line_product_ids[k, :num_lines].tolist()
+                        order_quantities = line_quantities[k, :num_lines].tolist()
+                        order_discounts = line_discounts[k, :num_lines].tolist()
+                        order_prices = line_prices[k, :num_lines].tolist()
+                        order_final_prices = line_final_prices[k, :num_lines].tolist()
+                        order_taxes = line_taxes[k, :num_lines].tolist()
                         
-                        order_line_details.append({
-                            'product_id': product['real_id'],
-                            'quantity': quantity,
-                            'unit_price': round(unit_price, 2),
-                            'discount_percentage': round(discount_pct, 2),
-                            'final_unit_price': round(final_unit_price, 2),
-                            'line_item_tax_amount': round(line_tax, 2)
-                        })
-                    
-                    # Calculate order totals
-                    total_tax = sum(line['line_item_tax_amount'] for line in order_line_details)
-                    shipping_cost = random.uniform(10, 100) if shipping_method else 0
-                    grand_total = subtotal + total_tax + shipping_cost
-                    
-                    # Order status and dates
-                    if order_date < date.today() - timedelta(days=7):
-                        status = random.choice(['COMPLETED', 'SHIPPED', 'CANCELLED'])
-                        if status in ['COMPLETED', 'SHIPPED']:
-                            shipped_date = order_date + timedelta(days=random.randint(1, 7))
-                            payment_due_date = order_date + timedelta(days=customer['credit_terms'])
+                        order_line_details = [
+                            {
+                                'product_id': product_id,
+                                'quantity': quantity,
+                                'unit_price': unit_price,
+                                'discount_percentage': discount_pct,
+                                'final_unit_price': final_unit_price,
+                                'line_item_tax_amount': line_tax
+                            }
+                            for product_id, quantity, unit_price, discount_pct, final_unit_price, line_tax in zip(
+                                order_product_ids, order_quantities, order_prices, order_discounts, order_final_prices, order_taxes
+                            )
+                        ]
+                        
+                        # Order status and dates
+                        if order_date < recent_cutoff:
+                            status = _choice(['COMPLETED', 'SHIPPED', 'CANCELLED'])
+                            if status in ['COMPLETED', 'SHIPPED']:
+                                shipped_date = order_date + day_offsets[ship_days[k]]
+                                payment_due_date = order_date + payment_terms
+                            else:
+                                shipped_date = None
+                                payment_due_date = None
                         else:
+                            status = _choice(['PENDING', 'PROCESSING', 'APPROVED'])
                             shipped_date = None
-                            payment_due_date = None
-                    else:
-                        status = random.choice(['PENDING', 'PROCESSING', 'APPROVED'])
-                        shipped_date = None
-                        payment_due_date = order_date + timedelta(days=customer['credit_terms'])
-                    
-                    requested_delivery = order_date + timedelta(days=random.randint(7, 21))
-                    
-                    # Generate unique order number
-                    attempts = 0
-                    max_attempts = 10
-                    while attempts < max_attempts:
-                        order_number = self.fake_us.order_number()
-                        if order_number not in used_order_numbers:
-                            used_order_numbers.add(order_number)
-                            break
-                        attempts += 1
-                    else:
-                        order_number = f"SO-{datetime.now().year}-{order_num:06d}"
-                        used_order_numbers.add(order_number)
-                    
-                    order = {
-                        'order_number': order_number,
-                        'customer_id': customer['real_id'],
-                        'employee_id': employee['real_id'],
-                        'order_date': order_date,
-                        'requested_delivery_date': requested_delivery,
-                        'shipped_date': shipped_date,
-                        'payment_due_date': payment_due_date,
-                        'status': status,
-                        'subtotal_amount': round(subtotal, 2),
-                        'tax_amount': round(total_tax, 2),
-                        'shipping_cost': round(shipping_cost, 2),
-                        'grand_total_amount': round(grand_total, 2),
-                        'billing_address_id': billing_address,
-                        'shipping_address_id': shipping_address,
-                        'shipping_method_id': shipping_method,
-                        'tracking_number': f"TRK{random.randint(100000000, 999999999)}" if shipped_date else None,
-                        'currency_code': currency,
-                        'notes': f"Order for {customer['company_name']}",
-                        'line_details': order_line_details
-                    }
+                            payment_due_date = order_date + payment_terms
+                        
+                        requested_delivery = order_date + day_offsets[delivery_days[k]]
+                        
+                        order = {
+                            'order_number': order_numbers[batch_start + k],
+                            'customer_id': customer_id,
+                            'employee_id': employee_id,
+                            'order_date': order_date,
+                            'requested_delivery_date': requested_delivery,
+                            'shipped_date': shipped_date,
+                            'payment_due_date': payment_due_date,
+                            'status': status,
+                            'subtotal_amount': subtotals[k],
+                            'tax_amount': total_taxes[k],
+                            'shipping_cost': shipping_costs[k],
+                            'grand_total_amount': grand_totals[k],
+                            'billing_address_id': billing_address,
+                            'shipping_address_id': shipping_address,
+                            'shipping_method_id': shipping_method,
+                            'tracking_number': str(tracking_numbers[k]) if shipped_date else None,
+                            'currency_code': currency,
+                            'notes': str(order_notes[k]),
+                            'line_details': order_line_details
+                        }
+                        
+                        pending_orders.append(order)
                     
-                    orders.append(order)
+                    except Exception as e:
+                        self.logger.warning(f"Error generating order {order_num}: {e}")
+                        continue
                 
-                except Exception as e:
-                    self.logger.warning(f"Error generating order {order_num}: {e}")
-                    continue
+                if pending_orders:
+                    lines_written += self._write_orders(pending_orders)
+                    orders_written += len(pending_orders)
+                    pending_orders = []
         
         except Exception as e:
             self.logger.error(f"Error in sales order generation loop: {e}")
+            self.conn.rollback()
             raise
         
-        # Insert orders
+        self.conn.commit()
+        self.logger.info(f"Generated {orders_written} sales orders with {lines_written} line items")
+    
+    def _write_orders(self, orders: List[Dict[str, Any]]) -> int:
+        """COPY a batch of orders and their lines; returns the number of lines written."""
+        order_ids = self._reserve_ids('orders_order_id_seq', len(orders))
+        
+        orders_insert = [
+            (order_id, order['order_number'], order['customer_id'], order['employee_id'], order['order_date'],
+             order['requested_delivery_date'], order['shipped_date'], order['payment_due_date'],
+             order['status'], order['subtotal_amount'], order['tax_amount'], order['shipping_cost'],
+             order['grand_total_amount'], order['billing_address_id'], order['shipping_address_id'],
+             order['shipping_method_id'], order['tracking_number'], order['currency_code'], order['notes'])
+            for order_id, order in zip(order_ids, orders)
+        ]
+        
+        # Detail rows are generated lazily while COPY streams them
+        order_details = (
+            (order_id, line['product_id'], line['quantity'], line['unit_price'],
+             line['discount_percentage'], line['final_unit_price'], line['line_item_tax_amount'])
+            for order_id, order in zip(order_ids, orders)
+            for line in order['line_details']
+        )
+        line_count = sum(len(order['line_details']) for order in orders)
+        
         try:
-            self.logger.info(f"Inserting {len(orders)} orders into database")
-            
-            orders_insert = [
-                (order['order_number'], order['customer_id'], order['employee_id'], order['order_date'],
-                 order['requested_delivery_date'], order['shipped_date'], order['payment_due_date'],
-                 order['status'], order['subtotal_amount'], order['tax_amount'], order['shipping_cost'],
-                 order['grand_total_amount'], order['billing_address_id'], order['shipping_address_id'],
-                 order['shipping_method_id'], order['tracking_number'], order['currency_code'], order['notes'])
-                for order in orders
-            ]
-            
-            execute_batch(
-                self.cursor,
-                """INSERT INTO orders (order_number, customer_id, employee_id, order_date, requested_delivery_date, 
-                     shipped_date, payment_due_date, status, subtotal_amount, tax_amount, shipping_cost, 
-                     grand_total_amount, billing_address_id, shipping_address_id, shipping_method_id, 
-                     tracking_number, currency_code, notes) 
-                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);""",
-                orders_insert,
-                page_size=self.config.batch_size
-            )
-            
-            self.logger.info("Orders inserted successfully")
-            
+            self._copy_rows('orders', ORDER_COLUMNS, orders_insert)
+            self._copy_rows('order_details', ORDER_DETAIL_COLUMNS, order_details)
         except Exception as e:
             self.logger.error(f"Failed to insert orders: {e}")
-            if orders_insert:
-                self.logger.error(f"Sample order data: {orders_insert[0]}")
+            self.logger.error(f"Sample order data: {orders_insert[0]}")
             raise
         
-        try:
-            # Get order IDs
-            self.cursor.execute("SELECT order_id, order_number FROM orders;")
-            order_number_to_id = {order_number: order_id for order_id, order_number in self.cursor.fetchall()}
-            
-            self.logger.info(f"Retrieved {len(order_number_to_id)} order IDs")
-            
-            # Insert order details
-            for order in orders:
-                order_id = order_number_to_id.get(order['order_number'])
-                if not order_id:
-                    self.logger.warning(f"Order ID not found for order number {order['order_number']}")
-                    continue
-                    
-                for line in order['line_details']:
-                    order_details.append((
-                        order_id, line['product_id'], line['quantity'], line['unit_price'],
-                        line['discount_percentage'], line['final_unit_price'], line['line_item_tax_amount']
-                    ))
-            
-            self.logger.info(f"Inserting {len(order_details)} order detail lines")
-            
-            execute_batch(
-                self.cursor,
-                "INSERT INTO order_details (order_id, product_id, quantity, unit_price, discount_percentage, final_unit_price, line_item_tax_amount) VALUES (%s, %s, %s, %s, %s, %s, %s);",
-                order_details,
-                page_size=self.config.batch_size
-            )
+        self.logger.debug(f"Wrote {len(orders_insert)} orders with {line_count} line items")
+        return line_count
+    
+    def _resolve_line_prices(self, rng: np.random.Generator, product_ids: np.ndarray,
+                             order_currencies: np.ndarray, order_ordinals: np.ndarray) -> np.ndarray:
+        """Unit price for every (order, line) slot in the order currency.
+        
+        Uses the latest product price in the order currency that has not ended by the order date,
+        falling back to the USD price with an approximate conversion, then to a random price.
+        """
+        self.cursor.execute("SELECT product_id, currency_code, price, effective_date, end_date FROM product_prices;")
+        price_rows = self.cursor.fetchall()
+        
+        # Small integer codes per currency so (product, currency) pairs become one sortable int64 key
+        currency_codes = {code: n for n, code in enumerate(sorted({row[1] for row in price_rows}))}
+        num_currencies = max(len(currency_codes), 1)
+        no_end = np.iinfo(np.int64).max
+        
+        pp_product_id = np.array([row[0] for row in price_rows], dtype=np.int64)
+        pp_currency_code = np.array([currency_codes[row[1]] for row in price_rows], dtype=np.int64)
+        pp_effective_date = np.array([row[3].toordinal() for row in price_rows], dtype=np.int64)
+        pp_end_date = np.array([row[4].toordinal() if row[4] else no_end for row in price_rows], dtype=np.int64)
+        pp_price = np.array([float(row[2]) for row in price_rows], dtype=np.float64)
+        
+        order = np.lexsort((pp_effective_date, pp_currency_code, pp_product_id))
+        pp_key = (pp_product_id * num_currencies + pp_currency_code)[order]
+        pp_end_date = pp_end_date[order]
+        pp_price = pp_price[order]
+        
+        def find_prices(currency: np.ndarray) -> np.ndarray:
+            """Latest price per slot with end_date null or after the order date; NaN where none exists."""
+            keys = np.where(currency[:, None] >= 0, product_ids * num_currencies + currency[:, None], -1)
+            if not len(pp_key):
+                return np.full(keys.shape, np.nan)
+            lo = np.searchsorted(pp_key, keys, side='left')
+            hi = np.searchsorted(pp_key, keys, side='right')
+            ordinals = np.broadcast_to(order_ordinals[:, None], keys.shape)
             
-            self.logger.info("Order details inserted successfully")
+            # The latest effective row is the answer unless it has already ended;
+            # those rare slots walk back through older rows for the same pair
+            latest = np.maximum(hi - 1, 0)
+            found = (hi > lo) & (pp_end_date[latest] > ordinals)
+            prices = np.where(found, pp_price[latest], np.nan)
+            for slot in zip(*np.nonzero((hi > lo) & ~found)):
+                for row in range(hi[slot] - 2, lo[slot] - 1, -1):
+                    if pp_end_date[row] > ordinals[slot]:
+                        prices[slot] = pp_price[row]
+                        break
+            return prices
+        
+        prices = find_prices(np.array([currency_codes.get(c, -1) for c in order_currencies], dtype=np.int64))
+        
+        missing = np.isnan(prices)
+        if missing.any():
+            # Simple conversion (in real system, use exchange rates)
+            usd_code = currency_codes.get('USD', -1)
+            usd_prices = find_prices(np.full(len(order_currencies), usd_code, dtype=np.int64))
+            conversion = np.array([USD_CONVERSION.get(c, 1.0) for c in order_currencies])
+            prices = np.where(missing, usd_prices * conversion[:, None], prices)
             
-        except Exception as e:
-            self.logger.error(f"Failed to insert order details: {e}")
-            if order_details:
-                self.logger.error(f"Sample order detail data: {order_details[0]}")
-            raise
+            unpriced = np.isnan(prices)
+            prices[unpriced] = rng.uniform(50, 1000, int(unpriced.sum()))  # Fallback
         
-        self.conn.commit()
-        self.logger.info(f"Generated {len(orders)} sales orders with {len(order_details)} line items")
\ No newline at end of file
+        return prices
+    
+    @staticmethod
+    def _sample_product_indices(rng: np.random.Generator, lines_per_order: np.ndarray, num_products: int,
+                                width: int) -> np.ndarray:
+        """Draw product indices per order as one (num_orders, width) array.
+        
+        The first `lines_per_order[i]` slots of row i are distinct; slots past an order's line
+        count are unused and may repeat.
+        """
+        picks = rng.integers(0, num_products, size=(len(lines_per_order), width))
+        
+        # Only repeats among the used slots matter: unused slots get distinct negative stand-ins
+        used = np.arange(width) < lines_per_order[:, None]
+        ordered = np.sort(np.where(used, picks, -1 - np.arange(width)), axis=1)
+        duplicate_rows = np.flatnonzero((ordered[:, 1:] == ordered[:, :-1]).any(axis=1))
+        
+        # Flagged rows are redrawn together as random permutations of the catalog, cut to `width`
+        if duplicate_rows.size:
+            keys = rng.random((duplicate_rows.size, num_products))
+            picks[duplicate_rows] = np.argpartition(keys, width - 1, axis=1)[:, :width]
+        
+        return picks
\ No newline at end of file
@@ -1,9 +1,108 @@
+import os
 import random
+import numpy as np
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta, date, datetime
-from psycopg2.extras import execute_batch
+from typing import Any, Dict, List, Optional, Tuple
 from .base import BaseGenerator
 
 
+# Faker names generated per locale for supplier contacts before names are reused
+SUPPLIER_NAME_POOL_SIZE = 1000
+
+# Supplier records kept in the cache for purchase order generation
+Supplier = namedtuple('Supplier', [
+    'id', 'real_id', 'company_name', 'tax_id', 'contact_name', 'contact_email',
+    'contact_phone', 'address_id', 'territory_id', 'country_code'
+])
+
+# Inputs shared by every _build_po call in a process, installed by _init_po_worker
+_PO_STATE: Dict[str, Any] = {}
+
+
+def _init_po_worker(state: Dict[str, Any], reseed: bool = True) -> None:
+    """Install the purchase order inputs for this process (also the worker pool initializer)."""
+    if reseed:
+        # Forked workers inherit the parent's random state; reseed so they don't draw identical orders
+        random.seed()
+    _PO_STATE.clear()
+    _PO_STATE.update(state, rng=np.random.default_rng())
+
+
+def _build_po(po_num: int, po_id: int, supplier_index: int,
+              buyer_index: int) -> Optional[Tuple[tuple, List[tuple], List[tuple]]]:
+    """Build one purchase order row with its detail and line cost rows.
+    
+    Supplier and buyer are indices into the state's suppliers and employee ids, drawn for
+    all purchase orders at once by the caller. Detail rows come without their po_detail_id
+    and line cost rows start with the index of their line instead, so the caller can stamp
+    detail ids in order. Returns None when the supplier has no products.
+    """
+    state = _PO_STATE
+    rng = state['rng']
+    supplier = state['suppliers'][supplier_index]
+    
+    # Bound methods for the per-PO draws
+    _randint, _choice = random.randint, random.choice
+    
+    # Get products that this supplier can provide
+    supplier_products = state['supplier_products_by_id'].get(supplier.real_id, ())
+    if not supplier_products:
+        # Skip this PO if supplier has no products
+        return None
+    
+    order_date = state['start_date'] + timedelta(days=_randint(0, state['order_days']))
+    
+    # Delivery date
+    lead_time = _randint(14, 60)
+    expected_delivery = order_date + timedelta(days=lead_time)
+    
+    # Status based on date
+    if order_date < state['stale_cutoff']:
+        status = _choice(['RECEIVED', 'COMPLETED', 'CANCELLED'])
+        if status == 'RECEIVED':
+            received_date = expected_delivery + timedelta(days=_randint(-5, 10))
+        else:
+            received_date = None
+    else:
+        status = _choice(['PENDING', 'APPROVED', 'SHIPPED'])
+        received_date = None
+    
+    # Draw all lines of this PO at once: products, quantities and transport/duty cost shares
+    num_lines = _randint(1, state['max_lines'])
+    chosen = rng.integers(0, len(supplier_products), num_lines)
+    quantities = rng.integers(1, 101, num_lines)
+    line_totals = state['supplier_costs_by_id'][supplier.real_id][chosen] * quantities
+    transport_amounts = np.round(line_totals * rng.uniform(0.05, 0.12, num_lines), 2)
+    has_duties = rng.random(num_lines) < 0.6  # 60% chance of duties
+    duties_amounts = np.round(line_totals * rng.uniform(0.02, 0.08, num_lines), 2)
+    
+    cost_types = state['cost_types']
+    lines = []
+    line_costs = []
+    for line_index, (product_index, quantity, transport_cost, duties, duties_cost) in enumerate(zip(
+        chosen.tolist(), quantities.tolist(), transport_amounts.tolist(),
+        has_duties.tolist(), duties_amounts.tolist()
+    )):
+        product_id, unit_cost, cost_currency = supplier_products[product_index]
+        lines.append((po_id, product_id, quantity, unit_cost, quantity if status == 'RECEIVED' else 0))
+        
+        # Add line costs (transport, duties, etc.)
+        line_costs.append((line_index, cost_types['TRANSPORT'], transport_cost, cost_currency))
+        if duties:
+            line_costs.append((line_index, cost_types['DUTIES'], duties_cost, cost_currency))
+    
+    po_row = (
+        po_id, f"PO-{state['po_year']}-{po_num:07d}",  # Unique by construction
+        supplier.real_id, state['employee_ids'][buyer_index], order_date,
+        expected_delivery, received_date, status, round(float(line_totals.sum()), 2),
+        state['currency_by_territory'].get(supplier.territory_id, 'USD'),
+        f"Purchase order for {supplier.company_name}"
+    )
+    return po_row, lines, line_costs
+
+
 class SupplierGenerator(BaseGenerator):
     """Generator for suppliers and purchase orders."""
     
@@ -13,26 +112,32 @@ class SupplierGenerator(BaseGenerator):
         
         # Reset supplier and purchase order sequences to start from 1
         try:
-            self.cursor.execute("ALTER SEQUENCE suppliers_supplier_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE purchase_orders_po_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE product_suppliers_product_supplier_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE purchase_order_details_po_detail_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE purchase_order_line_costs_line_cost_id_seq RESTART WITH 1;")
+            self._restart_sequences(
+                'suppliers_supplier_id_seq',
+                'purchase_orders_po_id_seq',
+                'product_suppliers_product_supplier_id_seq',
+                'purchase_order_details_po_detail_id_seq',
+                'purchase_order_line_costs_line_cost_id_seq'
+            )
             self.conn.commit()
             self.logger.debug("Reset supplier-related sequences to start from 1")
         except Exception as e:
             self.logger.warning(f"Could not reset supplier sequences: {e}")
         
-        # Generate addresses first
-        addresses = []
-        address_id = 1
+        # Territories with database ids, drawn for every address and supplier in one call each
+        valid_territories = [t for t in self.cache['territories'].values() if 'id' in t]
+        if valid_territories:
+            address_territories = random.choices(valid_territories, k=self.config.suppliers * 2)  # Extra addresses for customers
+            supplier_territories = random.choices(valid_territories, k=self.config.suppliers)
+        else:
+            self.logger.error("No valid territories available for supplier generation")
+            address_territories = supplier_territories = []
         
-        # Create addresses distributed across territories
-        for _ in range(self.config.suppliers * 2):  # Extra addresses for customers
-            territory = random.choice(list(self.cache['territories'].values()))
-            if 'id' not in territory:
-                continue
-                
+        # Create addresses distributed across territories, as COPY rows with ids reserved up front
+        real_address_ids = self._reserve_ids('addresses_address_id_seq', len(address_territories))
+        addresses_insert = []
+        
+        for real_id, territory in zip(real_address_ids, address_territories):
             faker = territory['faker']
             
             # Safe secondary address generation (not all locales support this)
@@ -40,78 +145,58 @@ class SupplierGenerator(BaseGenerator):
             if random.random() < 0.3:
                 secondary_address = self._safe_secondary_address(faker)
             
-            address = {
-                'id': address_id,
-                'address_line1': faker.street_address(),
-                'address_line2': secondary_address,
-                'city': faker.city(),
-                'postal_code': faker.postcode(),
-                'territory_id': territory['id'],
-                'country_id': territory['country_id']
-            }
-            
-            addresses.append(address)
-            address_id += 1
-        
-        # Insert addresses
-        addresses_insert = [
-            (addr['address_line1'], addr['address_line2'], addr['city'], 
-             addr['postal_code'], addr['territory_id'], addr['country_id'])
-            for addr in addresses
-        ]
-        
-        execute_batch(
-            self.cursor,
-            "INSERT INTO addresses (address_line1, address_line2, city, postal_code, territory_id, country_id) VALUES (%s, %s, %s, %s, %s, %s);",
-            addresses_insert,
-            page_size=self.config.batch_size
+            addresses_insert.append((
+                real_id, faker.street_address(), secondary_address, faker.city(),
+                faker.postcode(), territory['id'], territory['country_id']
+            ))
+        
+        self._copy_rows(
+            'addresses',
+            ['address_id', 'address_line1', 'address_line2', 'city', 'postal_code', 'territory_id', 'country_id'],
+            addresses_insert
         )
         
-        # Get address IDs
-        self.cursor.execute("SELECT address_id FROM addresses ORDER BY address_id;")
-        real_address_ids = [row[0] for row in self.cursor.fetchall()]
+        # Company names are drawn once per supplier; names that came up more than once get a numeric suffix
+        company_names = [territory['faker'].company() for territory in supplier_territories]
+        name_counts = Counter(company_names)
+        company_names = [
+            f"{name} #{supplier_id}" if name_counts[name] > 1 else name
+            for supplier_id, name in enumerate(company_names, start=1)
+        ]
         
-        # Generate suppliers
+        # Generate suppliers with ids reserved from the sequence up front
         suppliers = []
-        supplier_id = 1
-        used_company_names = set()
-        
-        for _ in range(self.config.suppliers):
-            # Choose a territory for the supplier
-            available_territories = [t for t in self.cache['territories'].values() if 'id' in t]
-            if not available_territories:
-                self.logger.error("No valid territories available for supplier generation")
-                break
-                
-            territory = random.choice(available_territories)
+        real_supplier_ids = self._reserve_ids('suppliers_supplier_id_seq', len(supplier_territories))
+        
+        # Contact details only need to look plausible: tax ids, emails and phones are templated and
+        # contact names are reused from a per-locale pool instead of calling faker for every supplier
+        name_pools = defaultdict(list)
+        
+        for supplier_id, (real_id, territory, company_name) in enumerate(
+            zip(real_supplier_ids, supplier_territories, company_names), start=1
+        ):
             faker = territory['faker']
             country_code = territory['country_code']
             
-            # Generate unique company name
-            attempts = 0
-            max_attempts = 10
-            while attempts < max_attempts:
-                company_name = faker.company()
-                if company_name not in used_company_names:
-                    used_company_names.add(company_name)
-                    break
-                attempts += 1
+            name_pool = name_pools[faker]
+            if len(name_pool) < SUPPLIER_NAME_POOL_SIZE:
+                name_pool.append(faker.name())
+                contact_name = name_pool[-1]
             else:
-                # If we can't find a unique name, append a number
-                company_name = f"{faker.company()} #{supplier_id}"
-                used_company_names.add(company_name)
+                contact_name = random.choice(name_pool)
             
-            supplier = {
-                'id': supplier_id,
-                'company_name': company_name,
-                'tax_id': faker.tax_id(country_code),
-                'contact_name': faker.name(),
-                'contact_email': faker.email(),
-                'contact_phone': faker.phone_number(),
-                'address_id': random.choice(real_address_ids),
-                'territory_id': territory['id'],
-                'country_code': country_code
-            }
+            supplier = Supplier(
+                id=supplier_id,
+                real_id=real_id,
+                company_name=company_name,
+                tax_id=f"{country_code}-{supplier_id:010d}",
+                contact_name=contact_name,
+                contact_email=f"contact{supplier_id}@sup{supplier_id}.example",
+                contact_phone=f"+1-555-{supplier_id:07d}",
+                address_id=random.choice(real_address_ids),
+                territory_id=territory['id'],
+                country_code=country_code
+            )
             
             # Ensure this supplier's territory is in the cache with proper structure
             if territory['id'] not in self.cache['territories']:
@@ -119,38 +204,26 @@ class SupplierGenerator(BaseGenerator):
             
             suppliers.append(supplier)
             self.cache['suppliers'][supplier_id] = supplier
-            supplier_id += 1
         
-        # Insert suppliers
         suppliers_insert = [
-            (sup['company_name'], sup['tax_id'], sup['contact_name'], 
-             sup['contact_email'], sup['contact_phone'], sup['address_id'])
+            (sup.real_id, sup.company_name, sup.tax_id, sup.contact_name, 
+             sup.contact_email, sup.contact_phone, sup.address_id)
             for sup in suppliers
         ]
         
-        execute_batch(
-            self.cursor,
-            "INSERT INTO suppliers (company_name, tax_id, contact_name, contact_email, contact_phone, address_id) VALUES (%s, %s, %s, %s, %s, %s);",
-            suppliers_insert,
-            page_size=self.config.batch_size
+        self._copy_rows(
+            'suppliers',
+            ['supplier_id', 'company_name', 'tax_id', 'contact_name', 'contact_email', 'contact_phone', 'address_id'],
+            suppliers_insert
         )
         
-        # Get real supplier IDs
-        self.cursor.execute("SELECT supplier_id, company_name FROM suppliers;")
-        supplier_name_to_id = {name: sup_id for sup_id, name in self.cursor.fetchall()}
-        
-        for sup in suppliers:
-            real_id = supplier_name_to_id.get(sup['company_name'])
-            if real_id:
-                sup['real_id'] = real_id
-        
         # Generate product-supplier relationships
         self.logger.info("Generating product-supplier relationships...")
         
         try:
             product_suppliers = []
-            products_with_real_ids = [p for p in self.cache['products'].values() if 'real_id' in p]
-            suppliers_with_real_ids = [s for s in suppliers if 'real_id' in s]
+            products_with_real_ids = self.cache['products_realized']
+            suppliers_with_real_ids = self.supplier_tuple  # Every supplier has its reserved id
             
             if not products_with_real_ids:
                 self.logger.error("No products with real IDs found for supplier relationships")
@@ -162,43 +235,36 @@ class SupplierGenerator(BaseGenerator):
             
             self.logger.info(f"Creating relationships for {len(products_with_real_ids)} products and {len(suppliers_with_real_ids)} suppliers")
             
-            # Create territory lookup by real database ID
-            territory_lookup = {}
-            for territory_info in self.cache['territories'].values():
-                if 'id' in territory_info:
-                    territory_lookup[territory_info['id']] = territory_info
+            territory_lookup = self.territory_by_id
+            
+            # Bound methods for the per-product loop
+            _randint, _sample, _uniform = random.randint, random.sample, random.uniform
             
             for product in products_with_real_ids:
                 # Each product has 1-3 suppliers
-                num_suppliers = random.randint(1, min(3, len(suppliers_with_real_ids)))
-                product_suppliers_list = random.sample(suppliers_with_real_ids, num_suppliers)
+                num_suppliers = _randint(1, min(3, len(suppliers_with_real_ids)))
+                product_suppliers_list = _sample(suppliers_with_real_ids, num_suppliers)
                 
                 for i, supplier in enumerate(product_suppliers_list):
                     # Safely get territory currency
-                    territory_id = supplier.get('territory_id')
+                    territory_id = supplier.territory_id
                     if territory_id in territory_lookup:
                         currency = territory_lookup[territory_id]['currency']
                     else:
-                        self.logger.warning(f"Territory {territory_id} not found for supplier {supplier.get('id', 'unknown')}, using USD")
+                        self.logger.warning(f"Territory {territory_id} not found for supplier {supplier.id}, using USD")
                         currency = 'USD'
                     
                     # Base cost varies by supplier
-                    base_cost = random.uniform(50, 2000)
-                    cost_variation = random.uniform(0.8, 1.2)  # ±20% variation between suppliers
+                    base_cost = _uniform(50, 2000)
+                    cost_variation = _uniform(0.8, 1.2)  # ±20% variation between suppliers
                     unit_cost = base_cost * cost_variation
                     
-                    relationship = {
-                        'product_id': product['real_id'],
-                        'supplier_id': supplier['real_id'],
-                        'supplier_product_code': f"SUP-{supplier['id']}-{product['id']:04d}",
-                        'unit_cost': round(unit_cost, 2),
-                        'cost_currency_code': currency,
-                        'lead_time_days': random.randint(7, 90),
-                        'is_preferred': i == 0,  # First supplier is preferred
-                        'effective_date': self.config.start_date
-                    }
-                    
-                    product_suppliers.append(relationship)
+                    product_suppliers.append((
+                        product['real_id'], supplier.real_id, f"SUP-{supplier.id}-{product['id']:04d}",
+                        round(unit_cost, 2), currency, _randint(7, 90),
+                        i == 0,  # First supplier is preferred
+                        self.config.start_date, None
+                    ))
         
         except Exception as e:
             self.logger.error(f"Error in product-supplier relationship generation: {e}")
@@ -206,27 +272,20 @@ class SupplierGenerator(BaseGenerator):
         
         # Insert product-supplier relationships
         if product_suppliers:
-            ps_insert = [
-                (ps['product_id'], ps['supplier_id'], ps['supplier_product_code'],
-                 ps['unit_cost'], ps['cost_currency_code'], ps['lead_time_days'],
-                 ps['is_preferred'], ps['effective_date'], None)
-                for ps in product_suppliers
-            ]
-            
             try:
-                self.logger.info(f"Inserting {len(ps_insert)} product-supplier relationships")
-                execute_batch(
-                    self.cursor,
-                    "INSERT INTO product_suppliers (product_id, supplier_id, supplier_product_code, unit_cost, cost_currency_code, lead_time_days, is_preferred, effective_date, end_date) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s);",
-                    ps_insert,
-                    page_size=self.config.batch_size
+                self.logger.info(f"Inserting {len(product_suppliers)} product-supplier relationships")
+                self._copy_rows(
+                    'product_suppliers',
+                    ['product_id', 'supplier_id', 'supplier_product_code', 'unit_cost', 'cost_currency_code',
+                     'lead_time_days', 'is_preferred', 'effective_date', 'end_date'],
+                    product_suppliers
                 )
                 self.logger.info("Product-supplier relationships inserted successfully")
             except Exception as e:
                 self.logger.error(f"Failed to insert product-supplier relationships: {e}")
                 # Log a sample of the data for debugging
-                if ps_insert:
-                    self.logger.error(f"Sample data: {ps_insert[0]}")
+                if product_suppliers:
+                    self.logger.error(f"Sample data: {product_suppliers[0]}")
                 raise
         else:
             self.logger.warning("No product-supplier relationships to insert")
@@ -242,13 +301,13 @@ class SupplierGenerator(BaseGenerator):
         self.logger.info("Generating purchase orders...")
         
         # Get employees who can create POs (procurement managers, etc.)
-        po_employees = [emp for emp in self.cache['employees'].values() if 'real_id' in emp]
+        po_employees = self.cache['employees_realized']
         if not po_employees:
             self.logger.warning("No employees available for purchase orders")
             return
         
-        # Get suppliers with real IDs
-        suppliers_with_ids = [s for s in self.cache['suppliers'].values() if 'real_id' in s]
+        # Get suppliers (every cached supplier has its reserved database id)
+        suppliers_with_ids = self.supplier_tuple
         if not suppliers_with_ids:
             self.logger.warning("No suppliers available for purchase orders")
             return
@@ -256,186 +315,109 @@ class SupplierGenerator(BaseGenerator):
         purchase_orders = []
         po_details = []
         po_line_costs = []
-        used_po_numbers = set()
         
         # Get cost type IDs
         self.cursor.execute("SELECT cost_type_id, name FROM cost_types;")
         cost_types = {name: id for id, name in self.cursor.fetchall()}
         
-        # Create territory lookup by real database ID
-        territory_lookup = {}
-        for territory_info in self.cache['territories'].values():
-            if 'id' in territory_info:
-                territory_lookup[territory_info['id']] = territory_info
+        territory_lookup = self.territory_by_id
         
-        for po_num in range(1, self.config.purchase_orders + 1):
-            supplier = random.choice(suppliers_with_ids)
-            employee = random.choice(po_employees)
-            
-            # Generate order date with some business patterns
-            order_date = self.fake_us.date_between(
-                start_date=self.config.start_date,
-                end_date=self.config.end_date - timedelta(days=30)
-            )
-            
-            # Delivery date
-            lead_time = random.randint(14, 60)
-            expected_delivery = order_date + timedelta(days=lead_time)
-            
-            # Status based on date
-            if order_date < date.today() - timedelta(days=30):
-                status = random.choice(['RECEIVED', 'COMPLETED', 'CANCELLED'])
-                if status == 'RECEIVED':
-                    received_date = expected_delivery + timedelta(days=random.randint(-5, 10))
-                else:
-                    received_date = None
-            else:
-                status = random.choice(['PENDING', 'APPROVED', 'SHIPPED'])
-                received_date = None
-            
-            # Generate unique PO number
-            attempts = 0
-            max_attempts = 10
-            while attempts < max_attempts:
-                po_number = self.fake_us.po_number()
-                if po_number not in used_po_numbers:
-                    used_po_numbers.add(po_number)
-                    break
-                attempts += 1
-            else:
-                po_number = f"PO-{datetime.now().year}-{po_num:06d}"
-                used_po_numbers.add(po_number)
-            
-            po = {
-                'po_number': po_number,
-                'supplier_id': supplier['real_id'],
-                'employee_id': employee['real_id'],
-                'order_date': order_date,
-                'expected_delivery_date': expected_delivery,
-                'received_date': received_date,
-                'status': status,
-                'currency_code': territory_lookup.get(supplier['territory_id'], {}).get('currency', 'USD'),
-                'notes': f"Purchase order for {supplier['company_name']}"
-            }
-            
-            purchase_orders.append(po)
-            
-            # Generate PO line items
-            num_lines = random.randint(1, self.config.avg_po_lines * 2)
-            po_total = 0
-            
-            # Get products that this supplier can provide
-            self.cursor.execute("""
-                SELECT ps.product_id, ps.unit_cost, ps.cost_currency_code 
-                FROM product_suppliers ps 
-                WHERE ps.supplier_id = %s AND ps.end_date IS NULL
-            """, (supplier['real_id'],))
-            
-            supplier_products = self.cursor.fetchall()
-            if not supplier_products:
-                # Skip this PO if supplier has no products
+        # Products each supplier can currently provide, fetched once for all purchase orders
+        self.cursor.execute("""
+            SELECT ps.supplier_id, ps.product_id, ps.unit_cost, ps.cost_currency_code 
+            FROM product_suppliers ps 
+            WHERE ps.end_date IS NULL
+        """)
+        products_by_supplier = defaultdict(list)
+        for supplier_id, product_id, unit_cost, cost_currency in self.cursor.fetchall():
+            products_by_supplier[supplier_id].append((product_id, unit_cost, cost_currency))
+        supplier_products_by_id = {sup_id: tuple(products) for sup_id, products in products_by_supplier.items()}
+        
+        # Ids are reserved for every iteration up front; a skipped purchase order just leaves a gap
+        po_ids = self._reserve_ids('purchase_orders_po_id_seq', self.config.purchase_orders)
+        
+        # PO detail ids are stamped as results are collected, starting at the sequence's next value,
+        # so line costs can reference them directly; the sequence is moved past them afterwards
+        next_po_detail_id = self._reserve_ids('purchase_order_details_po_detail_id_seq', 1)[0]
+        
+        # Everything _build_po reads, installed once per process instead of pickled with every task
+        order_end_date = self.config.end_date - timedelta(days=30)
+        po_state = {
+            'suppliers': suppliers_with_ids,
+            'employee_ids': tuple(emp['real_id'] for emp in po_employees),
+            'supplier_products_by_id': supplier_products_by_id,
+            'supplier_costs_by_id': {
+                sup_id: np.array([float(unit_cost) for _, unit_cost, _ in products])
+                for sup_id, products in supplier_products_by_id.items()
+            },
+            'currency_by_territory': {tid: t['currency'] for tid, t in territory_lookup.items()},
+            'cost_types': cost_types,
+            'start_date': self.config.start_date,
+            'order_days': max(0, (order_end_date - self.config.start_date).days),
+            'max_lines': self.config.avg_po_lines * 2,
+            'po_year': datetime.now().year,
+            'stale_cutoff': date.today() - timedelta(days=30),
+        }
+        po_nums = range(1, self.config.purchase_orders + 1)
+        
+        # Supplier and buyer for every purchase order, drawn in one call each
+        rng = np.random.default_rng()
+        po_suppliers = rng.integers(0, len(suppliers_with_ids), self.config.purchase_orders).tolist()
+        po_buyers = rng.integers(0, len(po_state['employee_ids']), self.config.purchase_orders).tolist()
+        
+        # On a single core the pool only adds process startup and pickling on top of the same work
+        workers = os.cpu_count() or 1
+        if workers > 1 and self.config.purchase_orders >= self.config.parallel_po_threshold:
+            self.logger.debug(f"Building purchase orders in {workers} worker processes")
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_po_worker, initargs=(po_state,)) as executor:
+                results = list(executor.map(
+                    _build_po, po_nums, po_ids, po_suppliers, po_buyers,
+                    chunksize=max(1, self.config.purchase_orders // (workers * 8))
+                ))
+        else:
+            _init_po_worker(po_state, reseed=False)
+            results = map(_build_po, po_nums, po_ids, po_suppliers, po_buyers)
+        
+        for result in results:
+            if result is None:
                 continue
+            po_row, lines, line_costs = result
             
-            for line_num in range(num_lines):
-                if not supplier_products:
-                    break
-                    
-                product_id, unit_cost, cost_currency = random.choice(supplier_products)
-                quantity = random.randint(1, 100)
-                
-                line_total = float(unit_cost) * quantity
-                po_total += line_total
-                
-                po_detail = {
-                    'po_number': po['po_number'],
-                    'product_id': product_id,
-                    'quantity': quantity,
-                    'unit_cost': unit_cost,
-                    'received_quantity': quantity if status == 'RECEIVED' else 0
-                }
-                
-                po_details.append(po_detail)
-                
-                # Add line costs (transport, duties, etc.)
-                # Transport cost (percentage of line total)
-                transport_cost = line_total * random.uniform(0.05, 0.12)
-                po_line_costs.append({
-                    'po_detail_key': (po['po_number'], product_id),
-                    'cost_type_id': cost_types['TRANSPORT'],
-                    'amount': round(transport_cost, 2),
-                    'currency_code': cost_currency
-                })
-                
-                # Duties (if international)
-                if random.random() < 0.6:  # 60% chance of duties
-                    duties_cost = line_total * random.uniform(0.02, 0.08)
-                    po_line_costs.append({
-                        'po_detail_key': (po['po_number'], product_id),
-                        'cost_type_id': cost_types['DUTIES'],
-                        'amount': round(duties_cost, 2),
-                        'currency_code': cost_currency
-                    })
-            
-            # Update PO total
-            po['total_cost'] = round(po_total, 2)
+            first_detail_id = next_po_detail_id
+            next_po_detail_id += len(lines)
+            po_details.extend((po_detail_id,) + line for po_detail_id, line in enumerate(lines, start=first_detail_id))
+            po_line_costs.extend(
+                (first_detail_id + line_index, cost_type_id, amount, currency)
+                for line_index, cost_type_id, amount, currency in line_costs
+            )
+            purchase_orders.append(po_row)
         
         # Insert purchase orders
-        po_insert = [
-            (po['po_number'], po['supplier_id'], po['employee_id'], po['order_date'],
-             po['expected_delivery_date'], po['received_date'], po['status'],
-             po['total_cost'], po['currency_code'], po['notes'])
-            for po in purchase_orders
-        ]
-        
-        execute_batch(
-            self.cursor,
-            "INSERT INTO purchase_orders (po_number, supplier_id, employee_id, order_date, expected_delivery_date, received_date, status, total_cost, currency_code, notes) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s);",
-            po_insert,
-            page_size=self.config.batch_size
+        self._copy_rows(
+            'purchase_orders',
+            ['po_id', 'po_number', 'supplier_id', 'employee_id', 'order_date', 'expected_delivery_date',
+             'received_date', 'status', 'total_cost', 'currency_code', 'notes'],
+            purchase_orders
         )
         
-        # Get PO IDs
-        self.cursor.execute("SELECT po_id, po_number FROM purchase_orders;")
-        po_number_to_id = {po_number: po_id for po_id, po_number in self.cursor.fetchall()}
-        
         # Insert PO details
-        po_details_insert = [
-            (po_number_to_id[detail['po_number']], detail['product_id'], 
-             detail['quantity'], detail['unit_cost'], detail['received_quantity'])
-            for detail in po_details if detail['po_number'] in po_number_to_id
-        ]
-        
-        execute_batch(
-            self.cursor,
-            "INSERT INTO purchase_order_details (po_id, product_id, quantity, unit_cost, received_quantity) VALUES (%s, %s, %s, %s, %s);",
-            po_details_insert,
-            page_size=self.config.batch_size
+        self._copy_rows(
+            'purchase_order_details',
+            ['po_detail_id', 'po_id', 'product_id', 'quantity', 'unit_cost', 'received_quantity'],
+            po_details
         )
-        
-        # Get PO detail IDs for line costs
-        self.cursor.execute("""
-            SELECT pod.po_detail_id, po.po_number, pod.product_id 
-            FROM purchase_order_details pod 
-            JOIN purchase_orders po ON pod.po_id = po.po_id
-        """)
-        
-        po_detail_lookup = {(po_number, product_id): po_detail_id 
-                           for po_detail_id, po_number, product_id in self.cursor.fetchall()}
+        if po_details:
+            self.cursor.execute(
+                "SELECT setval(%s, %s);", ('purchase_order_details_po_detail_id_seq', next_po_detail_id - 1)
+            )
         
         # Insert line costs
-        line_costs_insert = [
-            (po_detail_lookup[cost['po_detail_key']], cost['cost_type_id'],
-             cost['amount'], cost['currency_code'])
-            for cost in po_line_costs if cost['po_detail_key'] in po_detail_lookup
-        ]
-        
-        if line_costs_insert:
-            execute_batch(
-                self.cursor,
-                "INSERT INTO purchase_order_line_costs (po_detail_id, cost_type_id, amount, currency_code) VALUES (%s, %s, %s, %s);",
-                line_costs_insert,
-                page_size=self.config.batch_size
+        if po_line_costs:
+            self._copy_rows(
+                'purchase_order_line_costs',
+                ['po_detail_id', 'cost_type_id', 'amount', 'currency_code'],
+                po_line_costs
             )
         
         self.conn.commit()
-        self.logger.info(f"Generated {len(purchase_orders)} purchase orders with {len(po_details)} line items and {len(line_costs_insert)} cost entries")
\ No newline at end of file
+        self.logger.info(f"Generated {len(purchase_orders)} purchase orders with {len(po_details)} line items and {len(po_line_costs)} cost entries")
\ No newline at end of file
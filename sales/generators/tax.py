@@ -1,5 +1,6 @@
-import random
-from psycopg2.extras import execute_batch
+import numpy as np
+from collections import defaultdict
+from psycopg2.extras import execute_values
 from .base import BaseGenerator
 
 
@@ -12,8 +13,10 @@ class TaxGenerator(BaseGenerator):
         
         # Reset tax-related sequences to start from 1
         try:
-            self.cursor.execute("ALTER SEQUENCE tax_types_tax_type_id_seq RESTART WITH 1;")
-            self.cursor.execute("ALTER SEQUENCE tax_rates_tax_rate_id_seq RESTART WITH 1;")
+            self._restart_sequences(
+                'tax_types_tax_type_id_seq',
+                'tax_rates_tax_rate_id_seq'
+            )
             self.conn.commit()
             self.logger.debug("Reset tax-related sequences to start from 1")
         except Exception as e:
@@ -28,9 +31,10 @@ class TaxGenerator(BaseGenerator):
             ('CUSTOM_DUTY', 'Custom Duty')
         ]
         
-        execute_batch(
+        # tax_types stays on a multi-row INSERT because COPY cannot skip existing names (ON CONFLICT)
+        execute_values(
             self.cursor,
-            "INSERT INTO tax_types (name, description) VALUES (%s, %s) ON CONFLICT (name) DO NOTHING;",
+            "INSERT INTO tax_types (name, description) VALUES %s ON CONFLICT (name) DO NOTHING;",
             required_tax_types,
             page_size=self.config.batch_size
         )
@@ -39,46 +43,43 @@ class TaxGenerator(BaseGenerator):
         self.cursor.execute("SELECT tax_type_id, name FROM tax_types;")
         tax_type_ids = {name: id for id, name in self.cursor.fetchall()}
         
-        # Generate tax rates for countries
+        # Regional tax patterns: (tax type, min rate, max rate) per region
+        regional_taxes = {
+            'Europe': ('VAT', 0.15, 0.25),  # VAT-based system, 15-25%
+            'North America': ('SALES_TAX', 0.05, 0.15),  # Sales tax system, 5-15%
+            'Asia': ('GST', 0.08, 0.20),  # Mixed GST/VAT system, 8-20%
+            'Oceania': ('GST', 0.08, 0.20)
+        }
+        default_tax = ('VAT', 0.10, 0.18)  # Default VAT system, 10-18%
+        
+        # Bucket countries by tax pattern so each bucket's rates come from one uniform draw
+        countries_by_tax = defaultdict(list)
+        for country_info in self.cache['countries'].values():
+            if 'id' in country_info:
+                countries_by_tax[regional_taxes.get(country_info['region'], default_tax)].append(country_info['id'])
+        
+        rng = np.random.default_rng()
         tax_rates = []
         
-        for country_code, country_info in self.cache['countries'].items():
-            if 'id' not in country_info:
-                continue
-                
-            country_id = country_info['id']
-            region = country_info['region']
-            
-            # Regional tax patterns
-            if region == 'Europe':
-                # VAT-based system
-                vat_rate = random.uniform(0.15, 0.25)  # 15-25% VAT
-                tax_rates.append((country_id, None, tax_type_ids['VAT'], vat_rate, self.config.start_date, None))
-                
-            elif region == 'North America':
-                # Sales tax system
-                sales_tax_rate = random.uniform(0.05, 0.15)  # 5-15% sales tax
-                tax_rates.append((country_id, None, tax_type_ids['SALES_TAX'], sales_tax_rate, self.config.start_date, None))
-                
-            elif region in ['Asia', 'Oceania']:
-                # Mixed GST/VAT system
-                gst_rate = random.uniform(0.08, 0.20)  # 8-20% GST
-                tax_rates.append((country_id, None, tax_type_ids['GST'], gst_rate, self.config.start_date, None))
-                
-            else:
-                # Default VAT system
-                vat_rate = random.uniform(0.10, 0.18)  # 10-18% VAT
-                tax_rates.append((country_id, None, tax_type_ids['VAT'], vat_rate, self.config.start_date, None))
-            
-            # Add customs duty
-            duty_rate = random.uniform(0.02, 0.08)  # 2-8% customs duty
-            tax_rates.append((country_id, None, tax_type_ids['CUSTOM_DUTY'], duty_rate, self.config.start_date, None))
+        for (tax_type, min_rate, max_rate), country_ids in countries_by_tax.items():
+            rates = rng.uniform(min_rate, max_rate, len(country_ids))
+            tax_rates.extend(
+                (country_id, None, tax_type_ids[tax_type], rate, self.config.start_date, None)
+                for country_id, rate in zip(country_ids, rates.tolist())
+            )
         
-        execute_batch(
-            self.cursor,
-            "INSERT INTO tax_rates (country_id, territory_id, tax_type_id, rate, effective_date, end_date) VALUES (%s, %s, %s, %s, %s, %s);",
-            tax_rates,
-            page_size=self.config.batch_size
+        # Add customs duty for every country
+        all_country_ids = [country_id for country_ids in countries_by_tax.values() for country_id in country_ids]
+        duty_rates = rng.uniform(0.02, 0.08, len(all_country_ids))  # 2-8% customs duty
+        tax_rates.extend(
+            (country_id, None, tax_type_ids['CUSTOM_DUTY'], rate, self.config.start_date, None)
+            for country_id, rate in zip(all_country_ids, duty_rates.tolist())
+        )
+        
+        self._copy_rows(
+            'tax_rates',
+            ['country_id', 'territory_id', 'tax_type_id', 'rate', 'effective_date', 'end_date'],
+            tax_rates
         )
         
         self.conn.commit()
@@ -15,10 +15,14 @@ class ValidationGenerator(BaseGenerator):
             ("Orders without customers", "SELECT COUNT(*) FROM orders o LEFT JOIN customers c ON o.customer_id = c.customer_id WHERE c.customer_id IS NULL"),
         ]
         
+        # Run every check as a scalar subquery of one statement to get all counts in a single round trip
+        self.cursor.execute(
+            "SELECT " + ", ".join(f"({query})" for _, query in validation_queries)
+        )
+        counts = self.cursor.fetchone()
+        
         all_valid = True
-        for description, query in validation_queries:
-            self.cursor.execute(query)
-            count = self.cursor.fetchone()[0]
+        for (description, _), count in zip(validation_queries, counts):
             if count > 0:
                 self.logger.warning(f"{description}: {count} records")
                 all_valid = False
@@ -15,32 +15,69 @@ Options:
     --drop-existing    Drop existing database before creating
     --test-connection  Test database connection only
     --populate-ref     Populate with basic reference data
+    --enable-io-uring  Switch the server to io_uring async I/O (PostgreSQL 18+ on Linux)
     --verbose          Enable verbose logging
     --help            Show this help message
 """
 
-import os
+import mmap
+import asyncio
 import sys
+import atexit
 import argparse
 import logging
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, Iterator, Tuple
 
 try:
-    import psycopg2
-    from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-    from psycopg2 import sql
+    import psycopg
+    from psycopg import sql
+    from psycopg.conninfo import make_conninfo
+    from psycopg_pool import ConnectionPool
 except ImportError:
-    print("Error: psycopg2 not installed. Install with: pip install psycopg2-binary")
+    print('Error: psycopg not installed. Install with: pip install "psycopg[binary,pool]"')
     sys.exit(1)
 
-try:
-    from dotenv import load_dotenv
-except ImportError:
-    print("Warning: python-dotenv not installed. Using environment variables directly.")
-    load_dotenv = None
+from config import get_config
+from queries import CONNECTION_TEST_QUERY, DATABASE_INFO_QUERY, REFERENCE_TABLES
+
+
+# Upper bound of pooled connections per database
+POOL_MAX_CONNECTIONS = 8
+
+# Existence check for the target database; run with prepare=True on the shared admin connection
+DB_EXISTS_QUERY = "SELECT 1 FROM pg_database WHERE datname = %s;"
+
+# Existence plus the number of other sessions connected to it, checked before a drop
+DB_STATUS_QUERY = """
+    SELECT
+        EXISTS (SELECT 1 FROM pg_database WHERE datname = %(db)s),
+        (SELECT COUNT(*) FROM pg_stat_activity WHERE datname = %(db)s AND pid <> pg_backend_pid());
+"""
+
+# Asynchronous I/O settings applied by --enable-io-uring (io_method needs PostgreSQL 18)
+IO_URING_MIN_SERVER_VERSION = 180000
+IO_WORKERS = 8
+
+# Per-table statistics, streamed through a server-side cursor
+TABLE_STATS_QUERY = """
+    SELECT 
+        schemaname,
+        relname as tablename,
+        n_tup_ins as inserts,
+        n_tup_upd as updates,
+        n_tup_del as deletes
+    FROM pg_stat_user_tables
+    ORDER BY relname;
+"""
 
+# Rows fetched per round trip when streaming TABLE_STATS_QUERY
+TABLE_STATS_ITERSIZE = 500
+
+# Set once logging.basicConfig has run, so further initializers skip it
+_LOG_CONFIGURED = False
 
 class DatabaseInitializer:
     """Handles database initialization for the sales system."""
@@ -50,18 +87,28 @@ class DatabaseInitializer:
         self.verbose = verbose
         self.logger = self._setup_logging()
         
+        # Connection pools keyed by database name (None is the server's default database)
+        self._pools: Dict[Optional[str], ConnectionPool] = {}
+        self._pools_lock = threading.Lock()
+        
+        # Autocommit connection to the default database, shared by all admin operations
+        self._admin: Optional[psycopg.Connection] = None
+        
     def _setup_logging(self) -> logging.Logger:
-        """Set up logging configuration."""
-        level = logging.DEBUG if self.verbose else logging.INFO
-        logging.basicConfig(
-            level=level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        """Set up logging configuration (only the first initializer configures it)."""
+        global _LOG_CONFIGURED
+        if not _LOG_CONFIGURED:
+            level = logging.DEBUG if self.verbose else logging.INFO
+            logging.basicConfig(
+                level=level,
+                format='%(asctime)s - %(levelname)s - %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+            _LOG_CONFIGURED = True
         return logging.getLogger(__name__)
     
-    def _get_connection(self, database: Optional[str] = None) -> psycopg2.extensions.connection:
-        """Get database connection."""
+    def _conninfo(self, database: Optional[str] = None) -> str:
+        """Connection string; no database means the server's default database."""
         conn_params = {
             'host': self.config['host'],
             'port': self.config['port'],
@@ -70,61 +117,111 @@ class DatabaseInitializer:
         }
         
         if database:
-            conn_params['database'] = database
-            
+            conn_params['dbname'] = database
+        
+        return make_conninfo(**conn_params)
+    
+    @contextmanager
+    def _admin_conn(self) -> Iterator[psycopg.Connection]:
+        """Yield the shared autocommit connection to the default database, opening it on first use."""
+        if self._admin is None or self._admin.closed:
+            try:
+                self._admin = psycopg.connect(self._conninfo(), autocommit=True)
+            except psycopg.Error as e:
+                self.logger.error(f"Failed to connect to database: {e}")
+                raise
+            self.logger.debug("Connected to database: default (admin)")
+        yield self._admin
+    
+    def _get_connection(self, database: Optional[str] = None) -> psycopg.Connection:
+        """Get a pooled database connection; hand it back with _put_connection."""
         try:
-            connection = psycopg2.connect(**conn_params)
+            with self._pools_lock:
+                pool = self._pools.get(database)
+                if pool is None:
+                    conninfo = self._conninfo(database)
+                    
+                    # The pool retries failed connections in the background until it times out;
+                    # connect once up front so errors like a missing database surface immediately
+                    psycopg.connect(conninfo).close()
+                    
+                    pool = self._pools[database] = ConnectionPool(
+                        conninfo, min_size=1, max_size=POOL_MAX_CONNECTIONS, open=True
+                    )
+            
+            connection = pool.getconn()
             self.logger.debug(f"Connected to database: {database or 'default'}")
             return connection
-        except psycopg2.Error as e:
+        except psycopg.Error as e:
             self.logger.error(f"Failed to connect to database: {e}")
             raise
     
+    def _put_connection(self, conn: psycopg.Connection, database: Optional[str] = None) -> None:
+        """Return a connection from _get_connection to its pool."""
+        with self._pools_lock:
+            pool = self._pools.get(database)
+        if pool is None:
+            conn.close()
+        else:
+            # End the implicit transaction left open by read-only queries (a no-op when idle)
+            conn.rollback()
+            pool.putconn(conn)
+    
+    def _close_pool(self, database: Optional[str] = None) -> None:
+        """Close every pooled connection to one database."""
+        with self._pools_lock:
+            pool = self._pools.pop(database, None)
+        if pool is not None:
+            pool.close()
+    
+    def close_all(self) -> None:
+        """Close all connection pools and the admin connection."""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+        
+        if self._admin is not None:
+            self._admin.close()
+            self._admin = None
+    
     def test_connection(self) -> bool:
-        """Test database connection."""
+        """Test database connection (runs test_connection_async to completion)."""
+        return asyncio.run(self.test_connection_async())
+    
+    async def test_connection_async(self) -> bool:
+        """Test database connection on an AsyncConnection of its own (see verify_async)."""
         try:
             self.logger.info("Testing database connection...")
             
-            # Test connection to PostgreSQL server
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()[0]
-            self.logger.info(f"PostgreSQL version: {version}")
-            
-            # Test connection to target database
+            db_name = self.config['database']
             try:
-                db_conn = self._get_connection(self.config['database'])
-                db_cursor = db_conn.cursor()
-                db_cursor.execute("SELECT current_database();")
-                db_name = db_cursor.fetchone()[0]
-                self.logger.info(f"Connected to database: {db_name}")
+                conn = await psycopg.AsyncConnection.connect(self._conninfo(db_name))
+            except psycopg.OperationalError:
+                # Connection failures carry no SQLSTATE, so a missing database is told apart from
+                # other failures through pg_database on the server's default database
+                async with await psycopg.AsyncConnection.connect(self._conninfo()) as conn:
+                    cursor = await conn.execute(DB_EXISTS_QUERY, (db_name,))
+                    if await cursor.fetchone() is not None:
+                        raise
+                    self.logger.warning(f"Database '{db_name}' does not exist")
+                    
+                    # Still check the server itself
+                    cursor = await conn.execute("SELECT version();")
+                    self.logger.info(f"PostgreSQL version: {(await cursor.fetchone())[0]}")
+            else:
+                async with conn:
+                    cursor = await conn.execute(CONNECTION_TEST_QUERY)
+                    version, current_db, table_count = await cursor.fetchone()
                 
-                # Test if tables exist
-                db_cursor.execute("""
-                    SELECT COUNT(*) 
-                    FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_name IN ('countries', 'products', 'orders');
-                """)
-                table_count = db_cursor.fetchone()[0]
+                self.logger.info(f"PostgreSQL version: {version}")
+                self.logger.info(f"Connected to database: {current_db}")
                 
                 if table_count > 0:
                     self.logger.info(f"Found {table_count} main tables in database")
                 else:
                     self.logger.info("No main tables found - database may need initialization")
-                    
-                db_cursor.close()
-                db_conn.close()
-                
-            except psycopg2.Error as e:
-                if "does not exist" in str(e):
-                    self.logger.warning(f"Database '{self.config['database']}' does not exist")
-                else:
-                    raise
-            
-            cursor.close()
-            conn.close()
             
             self.logger.info("Connection test successful!")
             return True
@@ -136,69 +233,118 @@ class DatabaseInitializer:
     def database_exists(self) -> bool:
         """Check if the target database exists."""
         try:
-            conn = self._get_connection()
-            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "SELECT 1 FROM pg_database WHERE datname = %s;",
-                (self.config['database'],)
-            )
-            exists = cursor.fetchone() is not None
-            
-            cursor.close()
-            conn.close()
-            return exists
+            with self._admin_conn() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(DB_EXISTS_QUERY, (self.config['database'],), prepare=True)
+                exists = cursor.fetchone() is not None
+                
+                cursor.close()
+                return exists
             
-        except psycopg2.Error as e:
+        except psycopg.Error as e:
             self.logger.error(f"Error checking database existence: {e}")
             return False
     
-    def create_database(self, drop_existing: bool = False) -> bool:
-        """Create the target database."""
+    def create_database(self, drop_existing: bool = False, enable_io_uring: bool = False) -> bool:
+        """Create the target database, optionally switching the server to io_uring I/O."""
         try:
-            conn = self._get_connection()
-            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-            cursor = conn.cursor()
-            
-            db_name = self.config['database']
-            
-            if drop_existing and self.database_exists():
-                self.logger.warning(f"Dropping existing database: {db_name}")
+            with self._admin_conn() as conn:
+                cursor = conn.cursor()
                 
-                # Terminate active connections
-                cursor.execute("""
-                    SELECT pg_terminate_backend(pg_stat_activity.pid)
-                    FROM pg_stat_activity
-                    WHERE pg_stat_activity.datname = %s
-                    AND pid <> pg_backend_pid();
-                """, (db_name,))
+                db_name = self.config['database']
+                
+                # Checked once on this connection and tracked through the drop below
+                if drop_existing:
+                    # Pooled connections to the database would block the drop (and be counted)
+                    self._close_pool(db_name)
+                    
+                    cursor.execute(DB_STATUS_QUERY, {'db': db_name}, prepare=True)
+                    exists, active_connections = cursor.fetchone()
+                else:
+                    cursor.execute(DB_EXISTS_QUERY, (db_name,), prepare=True)
+                    exists = cursor.fetchone() is not None
+                
+                if drop_existing and exists:
+                    self.logger.warning(f"Dropping existing database: {db_name}")
+                    
+                    # Terminate active connections; usually there are none in a dev reset
+                    if active_connections:
+                        self.logger.info(f"Terminating {active_connections} active connection(s) to {db_name}")
+                        cursor.execute("""
+                            SELECT pg_terminate_backend(pg_stat_activity.pid)
+                            FROM pg_stat_activity
+                            WHERE pg_stat_activity.datname = %s
+                            AND pid <> pg_backend_pid();
+                        """, (db_name,))
+                    
+                    # Drop database
+                    cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(
+                        sql.Identifier(db_name)
+                    ))
+                    self.logger.info(f"Database {db_name} dropped successfully")
+                    exists = False
+                
+                if not exists:
+                    self.logger.info(f"Creating database: {db_name}")
+                    cursor.execute(sql.SQL("CREATE DATABASE {}").format(
+                        sql.Identifier(db_name)
+                    ))
+                    self.logger.info(f"Database {db_name} created successfully")
+                else:
+                    self.logger.info(f"Database {db_name} already exists")
                 
-                # Drop database
-                cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(
-                    sql.Identifier(db_name)
-                ))
-                self.logger.info(f"Database {db_name} dropped successfully")
+                cursor.close()
             
-            if not self.database_exists():
-                self.logger.info(f"Creating database: {db_name}")
-                cursor.execute(sql.SQL("CREATE DATABASE {}").format(
-                    sql.Identifier(db_name)
-                ))
-                self.logger.info(f"Database {db_name} created successfully")
-            else:
-                self.logger.info(f"Database {db_name} already exists")
+            if enable_io_uring:
+                self.enable_io_uring()
             
-            cursor.close()
-            conn.close()
             return True
             
-        except psycopg2.Error as e:
+        except psycopg.Error as e:
             self.logger.error(f"Error creating database: {e}")
             return False
     
+    def enable_io_uring(self) -> bool:
+        """Configure the server for io_uring asynchronous I/O via ALTER SYSTEM.
+        
+        Only PostgreSQL 18+ has io_method, and io_uring is Linux-only. Failing here is not
+        fatal for initialization: the server just keeps its current I/O method.
+        """
+        if sys.platform != 'linux':
+            self.logger.warning("io_uring is only available on Linux - skipping")
+            return False
+        
+        try:
+            with self._admin_conn() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("SHOW server_version_num;")
+                server_version = int(cursor.fetchone()[0])
+                if server_version < IO_URING_MIN_SERVER_VERSION:
+                    self.logger.warning(
+                        f"io_method needs PostgreSQL 18 or later (server is {server_version}) - skipping"
+                    )
+                    cursor.close()
+                    return False
+                
+                cursor.execute("ALTER SYSTEM SET io_method = 'io_uring';")
+                cursor.execute(sql.SQL("ALTER SYSTEM SET io_workers = {};").format(sql.Literal(IO_WORKERS)))
+                cursor.execute("SELECT pg_reload_conf();")
+                
+                cursor.close()
+            
+            # io_workers is picked up by the reload; io_method only changes on a server restart
+            self.logger.info(f"Set io_method = io_uring and io_workers = {IO_WORKERS}")
+            self.logger.info("Restart the PostgreSQL server for io_method to take effect")
+            return True
+            
+        except psycopg.Error as e:
+            self.logger.warning(f"Could not enable io_uring: {e}")
+            return False
+    
     def run_schema_script(self, schema_file: str = "schema.sql") -> bool:
-        """Execute the schema creation script."""
+        """Execute the schema creation script in a single transaction."""
         try:
             schema_path = Path(schema_file)
             if not schema_path.exists():
@@ -207,34 +353,41 @@ class DatabaseInitializer:
             
             self.logger.info(f"Reading schema from: {schema_path}")
             
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema_sql = f.read()
+            # Decode straight from a read-only mapping of the file instead of a buffered read
+            with open(schema_path, 'rb') as f:
+                if schema_path.stat().st_size == 0:
+                    schema_sql = ''
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        schema_sql = str(mm, 'utf-8')
             
             # Connect to the target database
             conn = self._get_connection(self.config['database'])
-            cursor = conn.cursor()
-            
-            self.logger.info("Executing schema creation script...")
-            
-            # Execute the schema script
-            cursor.execute(schema_sql)
-            conn.commit()
-            
-            # Verify table creation
-            cursor.execute("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                ORDER BY table_name;
-            """)
-            
-            tables = [row[0] for row in cursor.fetchall()]
-            self.logger.info(f"Created {len(tables)} tables:")
-            for table in tables:
-                self.logger.info(f"  - {table}")
-            
-            cursor.close()
-            conn.close()
+            try:
+                cursor = conn.cursor()
+                
+                self.logger.info("Executing schema creation script...")
+                
+                # Execute the schema script
+                cursor.execute(schema_sql)
+                conn.commit()
+                
+                # Verify table creation
+                cursor.execute("""
+                    SELECT table_name 
+                    FROM information_schema.tables 
+                    WHERE table_schema = 'public' 
+                    ORDER BY table_name;
+                """)
+                
+                tables = [row[0] for row in cursor.fetchall()]
+                self.logger.info(f"Created {len(tables)} tables:")
+                for table in tables:
+                    self.logger.info(f"  - {table}")
+                
+                cursor.close()
+            finally:
+                self._put_connection(conn, self.config['database'])
             
             self.logger.info("Schema creation completed successfully!")
             return True
@@ -244,131 +397,51 @@ class DatabaseInitializer:
             return False
     
     def populate_reference_data(self) -> bool:
-        """Populate database with basic reference data."""
+        """Populate database with basic reference data in a single transaction."""
         try:
-            conn = self._get_connection(self.config['database'])
-            cursor = conn.cursor()
-            
             self.logger.info("Populating reference data...")
             
-            # Insert basic currencies
-            currencies_data = [
-                ('USD', 'US Dollar', '$'),
-                ('EUR', 'Euro', '€'),
-                ('GBP', 'British Pound', '£'),
-                ('JPY', 'Japanese Yen', '¥'),
-                ('CAD', 'Canadian Dollar', 'C$'),
-                ('AUD', 'Australian Dollar', 'A$'),
-                ('CHF', 'Swiss Franc', 'CHF'),
-                ('CNY', 'Chinese Yuan', '¥'),
-                ('INR', 'Indian Rupee', '₹'),
-                ('BRL', 'Brazilian Real', 'R$')
-            ]
-            
-            cursor.executemany("""
-                INSERT INTO currencies (currency_code, name, symbol) 
-                VALUES (%s, %s, %s)
-                ON CONFLICT (currency_code) DO NOTHING;
-            """, currencies_data)
-            
-            # Insert basic countries
-            countries_data = [
-                ('United States', 'USA', 'North America', 'USD'),
-                ('United Kingdom', 'GBR', 'Europe', 'GBP'),
-                ('Germany', 'DEU', 'Europe', 'EUR'),
-                ('France', 'FRA', 'Europe', 'EUR'),
-                ('Japan', 'JPN', 'Asia', 'JPY'),
-                ('Canada', 'CAN', 'North America', 'CAD'),
-                ('Australia', 'AUS', 'Oceania', 'AUD'),
-                ('Switzerland', 'CHE', 'Europe', 'CHF'),
-                ('China', 'CHN', 'Asia', 'CNY'),
-                ('India', 'IND', 'Asia', 'INR'),
-                ('Brazil', 'BRA', 'South America', 'BRL')
-            ]
-            
-            cursor.executemany("""
-                INSERT INTO countries (name, code, region, currency_code) 
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (name) DO NOTHING;
-            """, countries_data)
-            
-            # Insert basic tax types
-            tax_types_data = [
-                ('VAT', 'Value Added Tax'),
-                ('SALES_TAX', 'Sales Tax'),
-                ('GST', 'Goods and Services Tax'),
-                ('EXCISE', 'Excise Tax'),
-                ('CUSTOM_DUTY', 'Custom Duty')
-            ]
-            
-            cursor.executemany("""
-                INSERT INTO tax_types (name, description) 
-                VALUES (%s, %s)
-                ON CONFLICT (name) DO NOTHING;
-            """, tax_types_data)
-            
-            # Insert basic cost types
-            cost_types_data = [
-                ('PURCHASE', 'Product Purchase Cost'),
-                ('TRANSPORT', 'Transportation Cost'),
-                ('DUTIES', 'Import Duties'),
-                ('STORAGE', 'Storage and Warehousing'),
-                ('HANDLING', 'Handling and Processing'),
-                ('INSURANCE', 'Insurance Cost'),
-                ('OVERHEAD', 'General Overhead')
-            ]
-            
-            cursor.executemany("""
-                INSERT INTO cost_types (name, description) 
-                VALUES (%s, %s)
-                ON CONFLICT (name) DO NOTHING;
-            """, cost_types_data)
-            
-            # Insert basic roles
-            roles_data = [
-                ('CEO', 'Chief Executive Officer'),
-                ('Sales Manager', 'Sales Team Manager'),
-                ('Sales Representative', 'Sales Representative'),
-                ('Procurement Manager', 'Procurement Team Manager'),
-                ('Inventory Manager', 'Inventory Management'),
-                ('Customer Service', 'Customer Service Representative'),
-                ('Finance Manager', 'Finance Team Manager'),
-                ('Operations Manager', 'Operations Team Manager')
-            ]
-            
-            cursor.executemany("""
-                INSERT INTO roles (name, description) 
-                VALUES (%s, %s)
-                ON CONFLICT (name) DO NOTHING;
-            """, roles_data)
-            
-            conn.commit()
-            
-            # Verify data insertion
-            cursor.execute("SELECT COUNT(*) FROM currencies;")
-            currencies_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM countries;")
-            countries_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM tax_types;")
-            tax_types_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM cost_types;")
-            cost_types_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM roles;")
-            roles_count = cursor.fetchone()[0]
-            
-            self.logger.info(f"Reference data populated:")
-            self.logger.info(f"  - {currencies_count} currencies")
-            self.logger.info(f"  - {countries_count} countries")
-            self.logger.info(f"  - {tax_types_count} tax types")
-            self.logger.info(f"  - {cost_types_count} cost types")
-            self.logger.info(f"  - {roles_count} roles")
-            
-            cursor.close()
-            conn.close()
+            conn = self._get_connection(self.config['database'])
+            try:
+                cursor = conn.cursor()
+                
+                # Deferrable foreign keys (countries -> currencies) are checked once at commit, not per row
+                cursor.execute("SET CONSTRAINTS ALL DEFERRED;")
+                
+                # All tables share one pipeline: every INSERT is sent back to back and the
+                # results are read after a single sync
+                with conn.pipeline():
+                    for table, columns, conflict_column, rows in REFERENCE_TABLES:
+                        placeholders = ', '.join(['%s'] * len(columns))
+                        cursor.executemany(
+                            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+                            f"ON CONFLICT ({conflict_column}) DO NOTHING;",
+                            rows
+                        )
+                
+                conn.commit()
+                
+                # Verify data insertion (all counts in one round trip)
+                cursor.execute("""
+                    SELECT
+                        (SELECT COUNT(*) FROM currencies),
+                        (SELECT COUNT(*) FROM countries),
+                        (SELECT COUNT(*) FROM tax_types),
+                        (SELECT COUNT(*) FROM cost_types),
+                        (SELECT COUNT(*) FROM roles);
+                """)
+                currencies_count, countries_count, tax_types_count, cost_types_count, roles_count = cursor.fetchone()
+                
+                self.logger.info(f"Reference data populated:")
+                self.logger.info(f"  - {currencies_count} currencies")
+                self.logger.info(f"  - {countries_count} countries")
+                self.logger.info(f"  - {tax_types_count} tax types")
+                self.logger.info(f"  - {cost_types_count} cost types")
+                self.logger.info(f"  - {roles_count} roles")
+                
+                cursor.close()
+            finally:
+                self._put_connection(conn, self.config['database'])
             
             return True
             
@@ -377,66 +450,42 @@ class DatabaseInitializer:
             return False
     
     def get_database_info(self) -> Dict[str, Any]:
-        """Get database information and statistics."""
+        """Get database information and statistics (runs get_database_info_async to completion)."""
+        return asyncio.run(self.get_database_info_async())
+    
+    async def get_database_info_async(self) -> Dict[str, Any]:
+        """Get database information and statistics on an AsyncConnection of its own."""
         try:
-            conn = self._get_connection(self.config['database'])
-            cursor = conn.cursor()
-            
-            # Get table information
-            cursor.execute("""
-                SELECT 
-                    schemaname,
-                    tablename,
-                    n_tup_ins as inserts,
-                    n_tup_upd as updates,
-                    n_tup_del as deletes
-                FROM pg_stat_user_tables
-                ORDER BY tablename;
-            """)
-            
-            tables_info = cursor.fetchall()
-            
-            # Get database size
-            cursor.execute("""
-                SELECT pg_size_pretty(pg_database_size(%s));
-            """, (self.config['database'],))
-            
-            db_size = cursor.fetchone()[0]
-            
-            cursor.close()
-            conn.close()
+            async with await psycopg.AsyncConnection.connect(self._conninfo(self.config['database'])) as conn:
+                cursor = await conn.execute(DATABASE_INFO_QUERY)
+                db_size, table_count = await cursor.fetchone()
+                
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    async with conn.cursor(name='tables_info') as stats_cursor:
+                        stats_cursor.itersize = TABLE_STATS_ITERSIZE
+                        await stats_cursor.execute(TABLE_STATS_QUERY)
+                        async for schemaname, tablename, inserts, updates, deletes in stats_cursor:
+                            self.logger.debug(
+                                f"  {schemaname}.{tablename}: {inserts} inserts, {updates} updates, {deletes} deletes"
+                            )
             
             return {
                 'database_name': self.config['database'],
                 'database_size': db_size,
-                'tables': tables_info,
-                'table_count': len(tables_info)
+                'table_count': table_count
             }
             
         except Exception as e:
             self.logger.error(f"Error getting database info: {e}")
             return {}
-
-
-def load_config() -> Dict[str, Any]:
-    """Load database configuration from environment."""
-    if load_dotenv:
-        load_dotenv()
-    
-    config = {
-        'host': os.getenv('DB_HOST', 'localhost'),
-        'port': int(os.getenv('DB_PORT', '5432')),
-        'database': os.getenv('DB_NAME', 'sales'),
-        'user': os.getenv('DB_USER', 'postgres'),
-        'password': os.getenv('PGPASSWORD', '')
-    }
     
-    # Validate configuration
-    if not config['password']:
-        print("Error: Database password not set. Check PGPASSWORD environment variable.")
-        sys.exit(1)
-    
-    return config
+    async def verify_async(self) -> Tuple[bool, Dict[str, Any]]:
+        """Run the connection test and collect the database info concurrently.
+        
+        Both are read-only and independent, so their round trips overlap on two connections.
+        """
+        success, info = await asyncio.gather(self.test_connection_async(), self.get_database_info_async())
+        return success, info
 
 
 def main():
@@ -465,6 +514,12 @@ def main():
         help='Populate with basic reference data'
     )
     
+    parser.add_argument(
+        '--enable-io-uring',
+        action='store_true',
+        help='Switch the server to io_uring async I/O (PostgreSQL 18+ on Linux, needs superuser)'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -480,17 +535,22 @@ def main():
     args = parser.parse_args()
     
     # Load configuration
-    config = load_config()
+    config = get_config()
+    
+    # Validate configuration
+    if not config['password']:
+        print("Error: Database password not set. Check PGPASSWORD environment variable.")
+        sys.exit(1)
     
     # Initialize database handler
     db_init = DatabaseInitializer(config, verbose=args.verbose)
+    atexit.register(db_init.close_all)
     
     try:
         if args.test_connection:
-            # Test connection only
-            success = db_init.test_connection()
+            # Test connection only, collecting the database info at the same time
+            success, info = asyncio.run(db_init.verify_async())
             if success:
-                info = db_init.get_database_info()
                 if info:
                     print(f"\nDatabase Info:")
                     print(f"  Name: {info['database_name']}")
@@ -505,7 +565,7 @@ def main():
         print("=" * 50)
         
         # Step 1: Create database
-        if not db_init.create_database(drop_existing=args.drop_existing):
+        if not db_init.create_database(drop_existing=args.drop_existing, enable_io_uring=args.enable_io_uring):
             print("Failed to create database")
             sys.exit(1)
         
@@ -520,8 +580,9 @@ def main():
                 print("Failed to populate reference data")
                 sys.exit(1)
         
-        # Step 4: Final verification
-        if not db_init.test_connection():
+        # Step 4: Final verification, overlapped with collecting the database info
+        success, info = asyncio.run(db_init.verify_async())
+        if not success:
             print("Final connection test failed")
             sys.exit(1)
         
@@ -529,7 +590,6 @@ def main():
         print("Database initialization completed successfully!")
         
         # Show database info
-        info = db_init.get_database_info()
         if info:
             print(f"\nDatabase Summary:")
             print(f"  Name: {info['database_name']}")
@@ -538,7 +598,7 @@ def main():
         
         print(f"\nNext steps:")
         print(f"  1. Run data generation: python generate_data.py")
-        print(f"  2. Test with sample queries: python -c \"import psycopg2; print('Ready!')\"")
+        print(f"  2. Test with sample queries: python -c \"import psycopg; print('Ready!')\"")
         
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
@@ -546,6 +606,8 @@ def main():
     except Exception as e:
         print(f"Unexpected error: {e}")
         sys.exit(1)
+    finally:
+        db_init.close_all()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,91 @@
+"""
+Reference data and SQL shared by the sales database scripts; kept free of driver imports.
+"""
+
+
+# Basic currencies
+CURRENCIES = [
+    ('USD', 'US Dollar', '$'),
+    ('EUR', 'Euro', '€'),
+    ('GBP', 'British Pound', '£'),
+    ('JPY', 'Japanese Yen', '¥'),
+    ('CAD', 'Canadian Dollar', 'C$'),
+    ('AUD', 'Australian Dollar', 'A$'),
+    ('CHF', 'Swiss Franc', 'CHF'),
+    ('CNY', 'Chinese Yuan', '¥'),
+    ('INR', 'Indian Rupee', '₹'),
+    ('BRL', 'Brazilian Real', 'R$')
+]
+
+# Basic countries (countries reference currencies)
+COUNTRIES = [
+    ('United States', 'USA', 'North America', 'USD'),
+    ('United Kingdom', 'GBR', 'Europe', 'GBP'),
+    ('Germany', 'DEU', 'Europe', 'EUR'),
+    ('France', 'FRA', 'Europe', 'EUR'),
+    ('Japan', 'JPN', 'Asia', 'JPY'),
+    ('Canada', 'CAN', 'North America', 'CAD'),
+    ('Australia', 'AUS', 'Oceania', 'AUD'),
+    ('Switzerland', 'CHE', 'Europe', 'CHF'),
+    ('China', 'CHN', 'Asia', 'CNY'),
+    ('India', 'IND', 'Asia', 'INR'),
+    ('Brazil', 'BRA', 'South America', 'BRL')
+]
+
+# Basic tax types
+TAX_TYPES = [
+    ('VAT', 'Value Added Tax'),
+    ('SALES_TAX', 'Sales Tax'),
+    ('GST', 'Goods and Services Tax'),
+    ('EXCISE', 'Excise Tax'),
+    ('CUSTOM_DUTY', 'Custom Duty')
+]
+
+# Basic cost types
+COST_TYPES = [
+    ('PURCHASE', 'Product Purchase Cost'),
+    ('TRANSPORT', 'Transportation Cost'),
+    ('DUTIES', 'Import Duties'),
+    ('STORAGE', 'Storage and Warehousing'),
+    ('HANDLING', 'Handling and Processing'),
+    ('INSURANCE', 'Insurance Cost'),
+    ('OVERHEAD', 'General Overhead')
+]
+
+# Basic roles
+ROLES = [
+    ('CEO', 'Chief Executive Officer'),
+    ('Sales Manager', 'Sales Team Manager'),
+    ('Sales Representative', 'Sales Representative'),
+    ('Procurement Manager', 'Procurement Team Manager'),
+    ('Inventory Manager', 'Inventory Management'),
+    ('Customer Service', 'Customer Service Representative'),
+    ('Finance Manager', 'Finance Team Manager'),
+    ('Operations Manager', 'Operations Team Manager')
+]
+
+# Reference tables in insert order (countries reference currencies): table, columns, conflict column, rows
+REFERENCE_TABLES = [
+    ('currencies', ('currency_code', 'name', 'symbol'), 'currency_code', CURRENCIES),
+    ('countries', ('name', 'code', 'region', 'currency_code'), 'name', COUNTRIES),
+    ('tax_types', ('name', 'description'), 'name', TAX_TYPES),
+    ('cost_types', ('name', 'description'), 'name', COST_TYPES),
+    ('roles', ('name', 'description'), 'name', ROLES)
+]
+
+# Server version, database and main table count for the connection test, in a single round trip
+CONNECTION_TEST_QUERY = """
+    SELECT version(), current_database(), (
+        SELECT COUNT(*) 
+        FROM information_schema.tables 
+        WHERE table_schema = 'public' 
+        AND table_name IN ('countries', 'products', 'orders')
+    );
+"""
+
+# Size and user table count of the connected database for get_database_info, as one row
+DATABASE_INFO_QUERY = """
+    SELECT
+        pg_size_pretty(pg_database_size(current_database())),
+        (SELECT COUNT(*) FROM pg_stat_user_tables);
+"""
@@ -52,7 +52,7 @@ CREATE TABLE countries (
     currency_code VARCHAR(3) NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (currency_code) REFERENCES currencies(currency_code)
+    FOREIGN KEY (currency_code) REFERENCES currencies(currency_code) DEFERRABLE INITIALLY IMMEDIATE
 );
 
 -- Territories table
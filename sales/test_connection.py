@@ -3,9 +3,9 @@
 Simple database connection test for the sales database.
 """
 
-import os
 import sys
-from dotenv import load_dotenv
+
+from config import get_config
 
 try:
     import psycopg2
@@ -15,15 +15,7 @@ except ImportError:
 
 def test_connection():
     """Test basic database connectivity."""
-    load_dotenv()
-    
-    config = {
-        'host': os.getenv('DB_HOST', 'localhost'),
-        'port': int(os.getenv('DB_PORT', '5432')),
-        'database': os.getenv('DB_NAME', 'sales'),
-        'user': os.getenv('DB_USER', 'postgres'),
-        'password': os.getenv('PGPASSWORD', '')
-    }
+    config = get_config()
     
     try:
         print(f"Connecting to {config['database']} at {config['host']}:{config['port']}")